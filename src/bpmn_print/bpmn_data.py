@@ -1,6 +1,16 @@
-from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 import re
-from typing import Dict, List, Optional, Tuple
+import sys
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from lxml.etree import _Element
 
@@ -9,12 +19,12 @@ from .xml_constants import (
     ATTR_ID,
     ATTR_NAME,
     ATTR_CALLED_ELEMENT,
-    BPMN_NS,
     CAMUNDA_NS_URI,
-    XPATH_CALL_ACTIVITY,
-    XPATH_SERVICE_TASK,
-    XPATH_CAMUNDA_SCRIPT,
-    XPATH_CAMUNDA_INPUT_PARAMETER,
+    TAG_PROCESS,
+    TAG_CALL_ACTIVITY,
+    TAG_SERVICE_TASK,
+    TAG_CAMUNDA_SCRIPT,
+    TAG_CAMUNDA_INPUT_PARAMETER,
 )
 
 # Camunda-specific attribute using namespace URI
@@ -28,14 +38,38 @@ JEXL_SCRIPT_PLACEHOLDER = "[See JEXL Scripts]"
 # JEXL expression pattern - matches both #{ } and ${ } style expressions
 # Compiled at module level for efficiency
 JEXL_PATTERN = re.compile(r"[#$]\{\s")
+# Bound search method, saving the attribute lookup on every parameter
+_jexl_search = JEXL_PATTERN.search
+
+# Parameter names and node targets repeat across a document (e.g. the
+# same delegate class on many service tasks); interning them stores one
+# string per distinct value instead of one per element
+_intern = sys.intern
+
+# Distinct delegate classes seen by _simplify_class_name; a document
+# typically reuses a handful of them across many service tasks
+CLASS_NAME_CACHE_SIZE = 1024
 
 # Node type
 NODE_TYPE_CALL_ACTIVITY = "callActivity"
 NODE_TYPE_SERVICE_TASK = "serviceTask"
 
+# Record kinds produced by _iter_records()
+_RECORD_NODE = 0
+_RECORD_PARAMETER = 1
+_RECORD_SCRIPT = 2
+_RECORD_PARAM_SCRIPT = 3
+
+# Elements visited by the single-pass walk in extract()
+_EXTRACT_TAGS = (
+    TAG_CALL_ACTIVITY,
+    TAG_SERVICE_TASK,
+    TAG_CAMUNDA_SCRIPT,
+    TAG_CAMUNDA_INPUT_PARAMETER,
+)
+
 
-@dataclass
-class Node:
+class Node(NamedTuple):
     """Represents a BPMN node (callActivity or serviceTask)."""
 
     name: str
@@ -43,8 +77,7 @@ class Node:
     target: str
 
 
-@dataclass
-class Parameter:
+class Parameter(NamedTuple):
     """Represents an input parameter.
 
     Attributes:
@@ -62,8 +95,7 @@ class Parameter:
     has_script: bool
 
 
-@dataclass
-class Script:
+class Script(NamedTuple):
     """Represents a JEXL script."""
 
     text: str
@@ -71,8 +103,7 @@ class Script:
     param_name: str
 
 
-@dataclass
-class BpmnExtractResult:
+class BpmnExtractResult(NamedTuple):
 
     nodes: List[Node]
     parameters: List[Parameter]
@@ -83,52 +114,67 @@ def find_parent_with_id(element: _Element) -> str:
     """Traverse up the tree to find the first ancestor with an
     'id' attribute
     """
-    current = element
-    while current is not None:
-        if "id" in current.attrib:
-            return current.get("id")
-        current = current.getparent()
+    # iterancestors() walks the parent chain in C; the element itself is
+    # checked first
+    for current in chain((element,), element.iterancestors()):
+        node_id = current.get(ATTR_ID)
+        if node_id is not None:
+            return node_id
     return UNKNOWN_VALUE
 
 
-def _get_element_name(element: _Element, default: str = UNKNOWN_VALUE) -> str:
-    """Get the name of an element, falling back to its ID or a default."""
-    return element.get(ATTR_NAME, element.get(ATTR_ID, default))
+def _find_owner_id(element: _Element, owner_ids: Dict[_Element, str]) -> str:
+    """Find the ID of the nearest ancestor (or the element itself) with an
+    'id' attribute, memoising the answer for every element on the way.
+
+    Scripts and input parameters of the same node share their
+    extensionElements/inputOutput ancestors, so after the first lookup
+    the rest resolve from the cache after one or two steps. Nothing is
+    computed for documents without scripts or input parameters.
+
+    Args:
+        element: The XML element to resolve
+        owner_ids: Cache shared across lookups on the same tree
+
+    Returns:
+        The owning ID, or UNKNOWN_VALUE if no ancestor has an ID
+    """
+    path = []
+    for current in chain((element,), element.iterancestors()):
+        node_id = owner_ids.get(current)
+        if node_id is not None:
+            break
+        path.append(current)
+        node_id = current.get(ATTR_ID)
+        if node_id is not None:
+            break
+    else:
+        node_id = UNKNOWN_VALUE
+    for current in path:
+        owner_ids[current] = node_id
+    return node_id
 
 
 def _is_jexl_expression(text: str) -> bool:
-    return JEXL_PATTERN.search(text) is not None
+    # Most values contain no brace at all; the substring test rejects
+    # them without entering the regex engine
+    return "{" in text and _jexl_search(text) is not None
 
 
+@lru_cache(maxsize=CLASS_NAME_CACHE_SIZE)
 def _simplify_class_name(class_name: str) -> str:
     """Extract the simple class name from a fully qualified class name.
 
+    Results are cached and interned, so service tasks sharing a delegate
+    class share one simple-name string.
+
     Args:
         class_name: Fully qualified class name (e.g., 'com.example.MyClass')
 
     Returns:
         Simple class name (e.g., 'MyClass') or empty string
     """
-    return class_name.rsplit(".", 1)[-1] if class_name else ""
-
-
-def _get_node_info(
-    element: _Element, id_to_name: Dict[str, str]
-) -> Tuple[str, str]:
-    """Extract node name and parameter name from an element.
-
-    Args:
-        element: The XML element to extract info from
-        id_to_name: Mapping from element IDs to their names
-
-    Returns:
-        Tuple of (node_name, param_name) where:
-        - node_name: Name of the parent node containing this element
-        - param_name: Name attribute of the element or default value
-    """
-    node_id = find_parent_with_id(element)
-    node_name = id_to_name.get(node_id, node_id)
-    return node_name, element.get(ATTR_NAME, DEFAULT_PARAM_NAME)
+    return _intern(class_name.rpartition(".")[2]) if class_name else ""
 
 
 def _create_parameter(
@@ -144,10 +190,9 @@ def _process_script_element(node_name: str, param_name: str) -> Parameter:
         node_name: Name of the node this parameter belongs to
         param_name: Name of the parameter
     """
-    parameter = _create_parameter(
+    return _create_parameter(
         node_name, param_name, JEXL_SCRIPT_PLACEHOLDER, True
     )
-    return parameter
 
 
 def _process_text_content(
@@ -167,58 +212,59 @@ def _process_text_content(
     """
     if _is_jexl_expression(text):
         # JEXL expression - add to scripts
-        script = Script(text, node_name, param_name)
-        parameter = _create_parameter(
-            node_name, param_name, JEXL_SCRIPT_PLACEHOLDER, True
+        return (
+            _create_parameter(
+                node_name, param_name, JEXL_SCRIPT_PLACEHOLDER, True
+            ),
+            Script(text, node_name, param_name),
         )
-        return parameter, script
-    else:
-        # Simple value
-        parameter = _create_parameter(node_name, param_name, text, False)
-        return parameter, None
+    # Simple value
+    return _create_parameter(node_name, param_name, text, False), None
+
+
+def _get_element_name(element: _Element, default: str = UNKNOWN_VALUE) -> str:
+    """Get the name of an element, falling back to its ID or a default.
+
+    Only a missing name falls back; an explicit name="" is kept, as the
+    diagram does for node labels.
+    """
+    # The ID is only read when the name attribute is absent
+    name = element.get(ATTR_NAME)
+    return name if name is not None else element.get(ATTR_ID, default)
 
 
 def _create_call_activity_node(call_activity: _Element) -> Node:
     return Node(
-        name=_get_element_name(call_activity),
-        type=NODE_TYPE_CALL_ACTIVITY,
-        target=call_activity.get(ATTR_CALLED_ELEMENT, ""),
+        _get_element_name(call_activity),
+        NODE_TYPE_CALL_ACTIVITY,
+        _intern(call_activity.get(ATTR_CALLED_ELEMENT, "")),
     )
 
 
-def _extract_call_activities(root: _Element) -> List[Node]:
-    return [
-        _create_call_activity_node(call_activity)
-        for call_activity in root.findall(XPATH_CALL_ACTIVITY, BPMN_NS)
-    ]
-
-
 def _create_service_task_node(service_task: _Element) -> Node:
-    class_name = service_task.get(CAMUNDA_CLASS_ATTR, "")
     return Node(
-        name=_get_element_name(service_task),
-        type=NODE_TYPE_SERVICE_TASK,
-        target=_simplify_class_name(class_name),
+        _get_element_name(service_task),
+        NODE_TYPE_SERVICE_TASK,
+        _simplify_class_name(service_task.get(CAMUNDA_CLASS_ATTR, "")),
     )
 
 
-def _extract_service_tasks(root: _Element) -> List[Node]:
-    return [
-        _create_service_task_node(service_task)
-        for service_task in root.findall(XPATH_SERVICE_TASK, BPMN_NS)
-    ]
+def _create_script_element(
+    scr: _Element, node_id: str, id_to_name: Dict[str, str]
+) -> Script:
+    """Create a Script from a camunda:script element.
 
+    Args:
+        scr: The camunda:script XML element
+        node_id: ID of the nearest ancestor with an 'id' attribute
+        id_to_name: Mapping from element IDs to their names
 
-def _extract_script_elements(
-    root: _Element, id_to_name: Dict[str, str]
-) -> List[Script]:
-    scripts = []
-    for scr in root.findall(XPATH_CAMUNDA_SCRIPT, BPMN_NS):
-        node_id = find_parent_with_id(scr)
-        node_name = id_to_name.get(node_id, node_id)
-        param_name = scr.getparent().get(ATTR_NAME, DEFAULT_SCRIPT_NAME)
-        scripts.append(Script(scr.text or "", node_name, param_name))
-    return scripts
+    Returns:
+        Script with the element text and its owning node/parameter names
+    """
+    node_name = id_to_name.get(node_id, node_id)
+    param_name = _intern(scr.getparent().get(ATTR_NAME, DEFAULT_SCRIPT_NAME))
+    return Script(scr.text or "", node_name, param_name)
 
 
 def _process_single_input_parameter(
@@ -234,72 +280,155 @@ def _process_single_input_parameter(
     Returns:
         Tuple of (Parameter, Optional[Script])
     """
-    # Check if it contains a script element
-    script_elem = inp.find(XPATH_CAMUNDA_SCRIPT, BPMN_NS)
+    # Check if it contains a script element. It may be a direct child or
+    # nested in a camunda:list value or camunda:map entry; the tag-filtered
+    # descendant scan stops at the first match
+    script_elem = next(inp.iterdescendants(TAG_CAMUNDA_SCRIPT), None)
     if script_elem is not None:
         # Has script element - will be shown in scripts section
         return _process_script_element(node_name, param_name), None
 
     # Check if it has text content
-    if inp.text:
+    text = inp.text
+    if text:
         # Has text content - may be JEXL expression or simple value
-        return _process_text_content(inp.text, node_name, param_name)
+        return _process_text_content(text, node_name, param_name)
 
     # Empty or no content
     return _create_parameter(node_name, param_name, "", False), None
 
 
-def _extract_input_parameters(
-    root: _Element, id_to_name: Dict[str, str]
-) -> Tuple[List[Parameter], List[Script]]:
-    """Extract input parameters and their associated scripts.
+def _process_input_parameter(
+    inp: _Element, node_id: str, id_to_name: Dict[str, str]
+) -> Tuple[Parameter, Optional[Script]]:
+    """Resolve the owning node of an input parameter and process it.
 
     Args:
-        root: Root element of the BPMN XML tree
+        inp: Input parameter XML element
+        node_id: ID of the nearest ancestor with an 'id' attribute
         id_to_name: Mapping from element IDs to their names
 
     Returns:
-        Tuple of (parameters, scripts) where:
-        - parameters: List of Parameter instances
-        - scripts: List of Script instances for JEXL expressions
+        Tuple of (Parameter, Optional[Script])
     """
-    parameters = []
-    scripts = []
+    # The node name falls back to the owner ID when it has no entry in
+    # id_to_name; the parameter name falls back to DEFAULT_PARAM_NAME
+    return _process_single_input_parameter(
+        inp,
+        id_to_name.get(node_id, node_id),
+        _intern(inp.get(ATTR_NAME, DEFAULT_PARAM_NAME)),
+    )
 
-    for inp in root.findall(XPATH_CAMUNDA_INPUT_PARAMETER, BPMN_NS):
-        node_name, param_name = _get_node_info(inp, id_to_name)
 
-        # Process the parameter and check for associated script
-        parameter, script = _process_single_input_parameter(
-            inp, node_name, param_name
-        )
-        parameters.append(parameter)
-        if script is not None:
-            scripts.append(script)
+def _iter_process_elements(root: _Element) -> Iterator[_Element]:
+    """Iterate the elements extract() cares about, process by process.
+
+    Processes are direct children of bpmn:definitions, so only those
+    subtrees are searched; the bpmndi:BPMNDiagram layout subtree, often
+    the bulk of the file, is never entered.
+    """
+    if root.tag == TAG_PROCESS:
+        processes = (root,)
+    else:
+        processes = root.iterchildren(TAG_PROCESS)
+    return chain.from_iterable(
+        process.iter(*_EXTRACT_TAGS) for process in processes
+    )
+
 
-    return parameters, scripts
+def extract_stream(
+    context: BpmnContext,
+    on_node: Callable[[Node], None],
+    on_parameter: Callable[[Parameter], None],
+    on_script: Callable[[Script], None],
+) -> None:
+    """Stream BPMN data to callbacks as it is extracted.
+
+    Records are delivered in document order without building any
+    intermediate lists, so a consumer can print or write each one as it
+    arrives. An input parameter holding a JEXL expression is followed
+    immediately by its Script.
+
+    Args:
+        context: BpmnContext containing parsed XML root and ID-to-name mapping
+        on_node: Called with each call activity or service task Node
+        on_parameter: Called with each input Parameter
+        on_script: Called with each Script
+    """
+    for kind, record in _iter_records(context):
+        if kind == _RECORD_NODE:
+            on_node(record)
+        elif kind == _RECORD_PARAMETER:
+            on_parameter(record)
+        else:
+            on_script(record)
+
+
+def _iter_records(context: BpmnContext) -> Iterator[Tuple[int, tuple]]:
+    """Yield (kind, record) pairs in document order.
+
+    Each process subtree is walked once; lxml's iter() tag filter runs
+    in C so only callActivity, serviceTask, camunda:script and
+    camunda:inputParameter elements reach Python.
+    """
+    id_to_name = context.id_to_name
+    owner_ids = {}
+
+    for elem in _iter_process_elements(context.root):
+        tag = elem.tag
+        if tag == TAG_CALL_ACTIVITY:
+            yield _RECORD_NODE, _create_call_activity_node(elem)
+        elif tag == TAG_SERVICE_TASK:
+            yield _RECORD_NODE, _create_service_task_node(elem)
+        elif tag == TAG_CAMUNDA_SCRIPT:
+            yield _RECORD_SCRIPT, _create_script_element(
+                elem, _find_owner_id(elem, owner_ids), id_to_name
+            )
+        else:
+            parameter, script = _process_input_parameter(
+                elem, _find_owner_id(elem, owner_ids), id_to_name
+            )
+            yield _RECORD_PARAMETER, parameter
+            if script is not None:
+                yield _RECORD_PARAM_SCRIPT, script
 
 
 def extract(context: BpmnContext) -> BpmnExtractResult:
     """Extract BPMN data from a BpmnContext.
 
+    Collects the records that extract_stream() delivers into lists.
+    Results are bucketed per kind to keep the output order stable (call
+    activities before service tasks, script elements before inline JEXL
+    expressions).
+
     Args:
         context: BpmnContext containing parsed XML root and ID-to-name mapping
 
     Returns:
         BpmnExtractResult containing nodes, parameters, and scripts
     """
-    root = context.root
-    id_to_name = context.id_to_name
-
-    # Extract nodes
-    nodes = []
-    nodes.extend(_extract_call_activities(root))
-    nodes.extend(_extract_service_tasks(root))
-
-    # Extract scripts and parameters
-    scripts = _extract_script_elements(root, id_to_name)
-    parameters, param_scripts = _extract_input_parameters(root, id_to_name)
+    call_activities = []
+    service_tasks = []
+    scripts = []
+    parameters = []
+    param_scripts = []
+
+    for kind, record in _iter_records(context):
+        if kind == _RECORD_NODE:
+            if record.type == NODE_TYPE_CALL_ACTIVITY:
+                call_activities.append(record)
+            else:
+                service_tasks.append(record)
+        elif kind == _RECORD_PARAMETER:
+            parameters.append(record)
+        elif kind == _RECORD_SCRIPT:
+            scripts.append(record)
+        else:
+            param_scripts.append(record)
+
+    # Grow the first bucket in place rather than concatenating into a
+    # third list
+    call_activities.extend(service_tasks)
     scripts.extend(param_scripts)
 
-    return BpmnExtractResult(nodes, parameters, scripts)
+    return BpmnExtractResult(call_activities, parameters, scripts)
@@ -1,11 +1,19 @@
+import sys
 import warnings
-from typing import List, Optional, Set
+from itertools import chain
+from typing import List, Optional, Set, Tuple
 
 import graphviz
 
 from .diagram_model import BpmnDiagramModel, BpmnEdge, BpmnNode, Condition
 from .errors import BpmnRenderError
-from .node_styles import NodeStyle, NODE_TYPE_CONFIG, GraphConfig
+from .node_styles import (
+    CONDITION_EDGE_ATTRS,
+    FLOW_NAME_EDGE_ATTRS,
+    NODE_STYLE_ATTRS,
+    NODE_TYPE_CONFIG,
+    GraphConfig,
+)
 from .path_utils import prepare_output_path
 from .xml_utils import BpmnContext
 from .xml_constants import (
@@ -13,16 +21,33 @@ from .xml_constants import (
     ATTR_NAME,
     ATTR_SOURCE_REF,
     ATTR_TARGET_REF,
-    BPMN_NS,
-    XPATH_SEQUENCE_FLOW,
-    XPATH_CONDITION_EXPRESSION,
+    TAG_CONDITION_EXPRESSION,
+    TAG_SEQUENCE_FLOW,
 )
 
 # Condition numbering starts at 1 for user-friendly display in diagrams
 CONDITION_START_NUMBER = 1
 
+# Node type for each Clark-notation tag in NODE_TYPE_CONFIG
+_NODE_TYPE_BY_TAG = {
+    config["tag"]: node_type for node_type, config in NODE_TYPE_CONFIG.items()
+}
+
+# Every element build_model() needs, selected in one tree walk
+_DIAGRAM_TAGS = (*_NODE_TYPE_BY_TAG, TAG_SEQUENCE_FLOW)
+
+
+def _intern_id(value: Optional[str]) -> Optional[str]:
+    # Node IDs and the sourceRef/targetRef values that point at them are
+    # interned, so checking edge references against the node ID set hits
+    # on identity instead of comparing characters. id_to_name keys are
+    # not interned, so lookups there still compare strings
+    return value if value is None else sys.intern(value)
+
 
 def _get_node_name(element, default_name: Optional[str], node_id: str) -> str:
+    # Only a missing name falls back; an explicit name="" stays empty,
+    # the same policy bpmn_data._get_element_name() applies to the tables
     if default_name is not None:
         # Use default_name as fallback when element has no name attribute
         return element.get(ATTR_NAME, default_name)
@@ -34,91 +59,114 @@ def _get_node_name(element, default_name: Optional[str], node_id: str) -> str:
 def _create_bpmn_node(
     element, node_type: str, default_name: Optional[str]
 ) -> BpmnNode:
-    node_id = element.get(ATTR_ID)
+    node_id = _intern_id(element.get(ATTR_ID))
     name = _get_node_name(element, default_name, node_id)
 
     return BpmnNode(node_id=node_id, name=name, node_type=node_type)
 
 
-def _extract_nodes_by_type(
-    root, ns: dict, node_type: str, config: dict
-) -> List[BpmnNode]:
-    xpath = config["xpath"]
-    default_name = config["default_name"]
-
-    return [
-        _create_bpmn_node(element, node_type, default_name)
-        for element in root.findall(xpath, ns)
-    ]
+def _create_bpmn_edge(flow, next_condition_number: int) -> BpmnEdge:
+    """Create a BpmnEdge from a sequenceFlow element.
 
+    Args:
+        flow: The sequenceFlow XML element
+        next_condition_number: Number to give the edge if it is conditional
 
-def _extract_all_nodes(root, ns: dict) -> List[BpmnNode]:
-    nodes = []
-    for node_type, config in NODE_TYPE_CONFIG.items():
-        type_nodes = _extract_nodes_by_type(root, ns, node_type, config)
-        nodes.extend(type_nodes)
-    return nodes
+    Returns:
+        BpmnEdge; condition_number is set only for conditional flows
+    """
+    flow_name = flow.get(ATTR_NAME, "")
 
+    # conditionExpression is always a direct child of sequenceFlow, so
+    # only the children are scanned, not the whole subtree. Most flows
+    # are unconditional and childless; len() skips building an iterator
+    condition_elem = (
+        next(flow.iterchildren(TAG_CONDITION_EXPRESSION), None)
+        if len(flow)
+        else None
+    )
+    condition_text = None
+    if condition_elem is not None and condition_elem.text:
+        condition_text = condition_elem.text.strip()
+
+    # Determine label and condition number
+    label = None
+    condition_number = None
+    if condition_text:
+        condition_number = next_condition_number
+        label = f"[{condition_number}]"
+    elif flow_name:
+        label = flow_name
+
+    return BpmnEdge(
+        source_id=_intern_id(flow.get(ATTR_SOURCE_REF)),
+        target_id=_intern_id(flow.get(ATTR_TARGET_REF)),
+        label=label,
+        condition=condition_text,
+        condition_number=condition_number,
+    )
 
-def _extract_all_edges(root, ns: dict) -> List[BpmnEdge]:
-    """Extract all sequence flow edges from the BPMN XML."""
-    edges = []
-    condition_counter = CONDITION_START_NUMBER
 
-    # Find all sequenceFlow elements (BPMN namespace required)
-    for flow in root.findall(XPATH_SEQUENCE_FLOW, ns):
-        source_id = flow.get(ATTR_SOURCE_REF)
-        target_id = flow.get(ATTR_TARGET_REF)
-        flow_name = flow.get(ATTR_NAME, "")
-
-        # Check for condition expression within the sequence flow
-        # XPath query uses BPMN namespace
-        condition_elem = flow.find(XPATH_CONDITION_EXPRESSION, ns)
-        condition_text = None
-        if condition_elem is not None and condition_elem.text:
-            condition_text = condition_elem.text.strip()
-
-        # Determine label and condition number
-        label = None
-        condition_number = None
-        if condition_text:
-            condition_number = condition_counter
-            condition_counter += 1
-            label = f"[{condition_number}]"
-        elif flow_name:
-            label = flow_name
-
-        edges.append(
-            BpmnEdge(
-                source_id=source_id,
-                target_id=target_id,
-                label=label,
-                condition=condition_text,
-                condition_number=condition_number,
-            )
-        )
+def _extract_nodes_and_edges(
+    root,
+) -> Tuple[List[BpmnNode], List[BpmnEdge], Set[str]]:
+    """Extract all nodes and sequence flow edges in a single tree walk.
 
-    return edges
+    lxml's iter() tag filter selects only node and sequenceFlow elements,
+    in C, so the document is traversed once instead of once per node
+    type. Nodes are bucketed per type to keep NODE_TYPE_CONFIG order;
+    edges and condition numbers follow document order. The set of valid
+    node IDs is collected in the same walk, and nodes with a missing or
+    empty ID are reported as they are found.
 
+    Args:
+        root: Root element of the parsed BPMN document
 
-def _validate_node_ids(nodes: List[BpmnNode]) -> Set[str]:
-    """validate node IDs and return set of valid IDs."""
+    Returns:
+        Tuple of (nodes, edges, node_ids)
+    """
+    nodes_by_type = {node_type: [] for node_type in NODE_TYPE_CONFIG}
+    edges = []
     node_ids = set()
-    for node in nodes:
-        if not node.node_id:
-            warnings.warn(
-                f"Found node with missing or empty ID: {node.name} "
-                f"(type: {node.node_type})",
-                UserWarning,
-            )
+    condition_counter = CONDITION_START_NUMBER
+
+    for elem in root.iter(*_DIAGRAM_TAGS):
+        tag = elem.tag
+        if tag == TAG_SEQUENCE_FLOW:
+            edge = _create_bpmn_edge(elem, condition_counter)
+            if edge.condition_number is not None:
+                condition_counter += 1
+            edges.append(edge)
         else:
-            node_ids.add(node.node_id)
-    return node_ids
+            node_type = _NODE_TYPE_BY_TAG[tag]
+            node = _create_bpmn_node(
+                elem, node_type, NODE_TYPE_CONFIG[node_type]["default_name"]
+            )
+            if node.node_id:
+                node_ids.add(node.node_id)
+            else:
+                warnings.warn(
+                    f"Found node with missing or empty ID: {node.name} "
+                    f"(type: {node.node_type})",
+                    UserWarning,
+                )
+            nodes_by_type[node_type].append(node)
+
+    nodes = list(chain.from_iterable(nodes_by_type.values()))
+    return nodes, edges, node_ids
 
 
 def _validate_edge_references(
     edges: List[BpmnEdge], node_ids: Set[str], id_to_name: dict
 ):
+    # Fast path for well-formed diagrams: one C-level subset test covers
+    # every reference. node_ids never holds None or "", so a missing
+    # sourceRef/targetRef also fails it and falls through to the loop
+    referenced = {edge.source_id for edge in edges}
+    referenced.update(edge.target_id for edge in edges)
+    if referenced <= node_ids:
+        return
+
     for edge in edges:
         if not edge.source_id:
             warnings.warn(
@@ -146,13 +194,9 @@ def _validate_edge_references(
 
 
 def build_model(context: BpmnContext) -> BpmnDiagramModel:
-    root = context.root
     id_to_name = context.id_to_name
-    ns = BPMN_NS
 
-    nodes = _extract_all_nodes(root, ns)
-    node_ids = _validate_node_ids(nodes)
-    edges = _extract_all_edges(root, ns)
+    nodes, edges, node_ids = _extract_nodes_and_edges(context.root)
 
     # Validate edge references
     _validate_edge_references(edges, node_ids, id_to_name)
@@ -169,50 +213,33 @@ def _create_graph() -> graphviz.Digraph:
 
 
 def _render_nodes(graph: graphviz.Digraph, model: BpmnDiagramModel) -> None:
+    add_node = graph.node
+    style_attrs = NODE_STYLE_ATTRS
     for node in model.nodes:
-        config = NODE_TYPE_CONFIG[node.node_type]
-        # Extract styling attributes (exclude xpath and default_name)
-        style_attrs = {
-            k: v
-            for k, v in config.items()
-            if k not in ("xpath", "default_name")
-        }
-        graph.node(node.node_id, node.name, **style_attrs)
-
-
-def _render_edge_with_condition(
-    graph: graphviz.Digraph, edge: BpmnEdge
-) -> None:
-    graph.edge(
-        edge.source_id,
-        edge.target_id,
-        label=edge.label,
-        fontsize=NodeStyle.CONDITION_FONT_SIZE,
-        fontcolor=NodeStyle.CONDITION_FONT_COLOR,
-    )
-
-
-def _render_edge_with_label(graph: graphviz.Digraph, edge: BpmnEdge) -> None:
-    graph.edge(
-        edge.source_id,
-        edge.target_id,
-        label=edge.label,
-        fontsize=NodeStyle.FLOW_NAME_FONT_SIZE,
-    )
-
-
-def _render_plain_edge(graph: graphviz.Digraph, edge: BpmnEdge) -> None:
-    graph.edge(edge.source_id, edge.target_id)
+        add_node(node.node_id, node.name, **style_attrs[node.node_type])
 
 
 def _render_edges(graph: graphviz.Digraph, model: BpmnDiagramModel) -> None:
+    # The three edge kinds are emitted inline with graph.edge bound once,
+    # avoiding a helper call per edge
+    add_edge = graph.edge
     for edge in model.edges:
         if edge.condition:
-            _render_edge_with_condition(graph, edge)
+            add_edge(
+                edge.source_id,
+                edge.target_id,
+                label=edge.label,
+                **CONDITION_EDGE_ATTRS,
+            )
         elif edge.label:
-            _render_edge_with_label(graph, edge)
+            add_edge(
+                edge.source_id,
+                edge.target_id,
+                label=edge.label,
+                **FLOW_NAME_EDGE_ATTRS,
+            )
         else:
-            _render_plain_edge(graph, edge)
+            add_edge(edge.source_id, edge.target_id)
 
 
 def render_model(model: BpmnDiagramModel, png_out: str) -> None:
@@ -223,9 +250,15 @@ def render_model(model: BpmnDiagramModel, png_out: str) -> None:
 
     # Prepare output path (removes extension, ensures directory exists)
     output_path, _ = prepare_output_path(png_out, auto_extension=".png")
+    image_path = f"{output_path}.{GraphConfig.FORMAT}"
 
     try:
-        graph.render(str(output_path), cleanup=True)
+        # pipe() feeds the DOT source to Graphviz on stdin and returns the
+        # image bytes, so no intermediate source file is written and then
+        # removed as render(cleanup=True) would do
+        image = graph.pipe()
+        with open(image_path, "wb") as image_file:
+            image_file.write(image)
     except graphviz.ExecutableNotFound as e:
         raise BpmnRenderError.render_failed(
             png_out, "Graphviz not installed or not in PATH"
@@ -7,6 +7,13 @@ from .errors import BpmnError
 from . import console
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
+
+
 def run() -> None:
     __version__: str = version("bpmn-print")
 
@@ -34,6 +41,17 @@ def run() -> None:
             "(default: 2200)"
         ),
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        metavar="N",
+        help=(
+            "number of files to convert in parallel, 1 to run serially "
+            "(default: CPU count)"
+        ),
+    )
     parser.add_argument("input_folder", help="input folder")
     parser.add_argument("output_folder", help="output folder")
 
@@ -45,6 +63,7 @@ def run() -> None:
             args.output_folder,
             args.keep,
             args.diagram_landscape_threshold,
+            args.jobs,
         )
     except BpmnError as e:
         # Catch all BPMN-specific errors
@@ -17,6 +17,14 @@ def set_level(level: int) -> None:
     _logger.setLevel(level)
 
 
+def get_level() -> int:
+    """Get the logging level for console output.
+    Returns:
+        The level last set with set_level()
+    """
+    return _logger.level
+
+
 def error(e: Exception) -> None:
     _logger.error("Error: %s", e)
 
@@ -1,8 +1,9 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Condition:
     number: int
     source_name: str
@@ -10,14 +11,14 @@ class Condition:
     expression: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BpmnNode:
     node_id: str
     name: str
     node_type: str  # Key from NODE_TYPE_CONFIG (e.g., "startEvent", "task")
 
 
-@dataclass
+@dataclass(slots=True)
 class BpmnEdge:
     source_id: str
     target_id: str
@@ -32,10 +33,12 @@ class BpmnDiagramModel:
     nodes: List[BpmnNode]
     edges: List[BpmnEdge]
     id_to_name: dict  # Mapping from element IDs to names
-    conditions: List[Condition] = field(default_factory=list, init=False)
 
-    def __post_init__(self):
-        self.conditions = self._build_conditions()
+    @cached_property
+    def conditions(self) -> List[Condition]:
+        # Built on first access and then kept; callers that only need
+        # nodes and edges never pay for it
+        return self._build_conditions()
 
     def _build_conditions(self) -> List[Condition]:
         conditions = []
@@ -1,11 +1,11 @@
 from .xml_constants import (
-    XPATH_START_EVENT,
-    XPATH_END_EVENT,
-    XPATH_TASK,
-    XPATH_SERVICE_TASK,
-    XPATH_CALL_ACTIVITY,
-    XPATH_EXCLUSIVE_GATEWAY,
-    XPATH_PARALLEL_GATEWAY,
+    TAG_START_EVENT,
+    TAG_END_EVENT,
+    TAG_TASK,
+    TAG_SERVICE_TASK,
+    TAG_CALL_ACTIVITY,
+    TAG_EXCLUSIVE_GATEWAY,
+    TAG_PARALLEL_GATEWAY,
 )
 
 
@@ -48,7 +48,7 @@ class GraphConfig:
 
 NODE_TYPE_CONFIG = {
     "startEvent": {
-        "xpath": XPATH_START_EVENT,
+        "tag": TAG_START_EVENT,
         "default_name": "Start",
         "shape": "circle",
         "style": "filled",
@@ -58,7 +58,7 @@ NODE_TYPE_CONFIG = {
         "fixedsize": "true",
     },
     "endEvent": {
-        "xpath": XPATH_END_EVENT,
+        "tag": TAG_END_EVENT,
         "default_name": "End",
         "shape": "doublecircle",
         "style": "filled",
@@ -68,14 +68,14 @@ NODE_TYPE_CONFIG = {
         "fixedsize": "true",
     },
     "task": {
-        "xpath": XPATH_TASK,
+        "tag": TAG_TASK,
         "default_name": None,  # Use node_id as fallback
         "shape": "box",
         "style": "rounded,filled",
         "fillcolor": NodeStyle.TASK_COLOR,
     },
     "serviceTask": {
-        "xpath": XPATH_SERVICE_TASK,
+        "tag": TAG_SERVICE_TASK,
         "default_name": None,  # Use node_id as fallback
         "shape": "box",
         "style": "rounded,filled",
@@ -83,7 +83,7 @@ NODE_TYPE_CONFIG = {
         "penwidth": "2",
     },
     "callActivity": {
-        "xpath": XPATH_CALL_ACTIVITY,
+        "tag": TAG_CALL_ACTIVITY,
         "default_name": None,  # Use node_id as fallback
         "shape": "box",
         "style": "rounded,filled,bold",
@@ -91,17 +91,34 @@ NODE_TYPE_CONFIG = {
         "penwidth": "3",
     },
     "exclusiveGateway": {
-        "xpath": XPATH_EXCLUSIVE_GATEWAY,
+        "tag": TAG_EXCLUSIVE_GATEWAY,
         "default_name": "X",
         "shape": "diamond",
         "style": "filled",
         "fillcolor": NodeStyle.EXCLUSIVE_GATEWAY_COLOR,
     },
     "parallelGateway": {
-        "xpath": XPATH_PARALLEL_GATEWAY,
+        "tag": TAG_PARALLEL_GATEWAY,
         "default_name": "+",
         "shape": "diamond",
         "style": "filled",
         "fillcolor": NodeStyle.PARALLEL_GATEWAY_COLOR,
     },
 }
+
+# Config keys used to find and name nodes rather than to style them
+NON_STYLE_KEYS = ("tag", "default_name")
+
+# Graphviz attributes per node type, split out of NODE_TYPE_CONFIG once
+# at import time so rendering does not rebuild them for every node
+NODE_STYLE_ATTRS = {
+    node_type: {k: v for k, v in config.items() if k not in NON_STYLE_KEYS}
+    for node_type, config in NODE_TYPE_CONFIG.items()
+}
+
+# Graphviz edge attributes, shared by every edge of the same kind
+CONDITION_EDGE_ATTRS = {
+    "fontsize": NodeStyle.CONDITION_FONT_SIZE,
+    "fontcolor": NodeStyle.CONDITION_FONT_COLOR,
+}
+FLOW_NAME_EDGE_ATTRS = {"fontsize": NodeStyle.FLOW_NAME_FONT_SIZE}
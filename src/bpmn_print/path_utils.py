@@ -10,15 +10,16 @@ def prepare_output_path(
     """Prepare an output path by ensuring the directory exists.
 
     This utility handles:
-    - Removing existing extensions when auto_extension is provided
+    - Removing the auto_extension suffix, if present, so it is not doubled
     - Creating parent directories if they don't exist
     - Returning both the prepared path and its parent directory
 
     Args:
         output_path: The desired output file path
         auto_extension: Extension that will be automatically added by the
-            rendering tool (e.g., ".png" for Graphviz). If provided, any
-            existing extension will be removed to prevent double extensions.
+            rendering tool (e.g., ".png" for Graphviz). If the path already
+            ends with it (case-insensitively) it is removed to prevent a
+            double extension; other suffixes are kept as part of the name.
 
     Returns:
         Tuple of (prepared_path, parent_directory)
@@ -33,9 +34,12 @@ def prepare_output_path(
     """
     path = Path(output_path)
 
-    # Remove extension if auto_extension is provided
+    # Remove the extension only when it is the one the tool will add back;
+    # a dot elsewhere in the name (e.g. "report.v2") is not an extension
     if auto_extension:
-        path = path.with_suffix("")
+        expected_suffix = "." + auto_extension.lstrip(".").lower()
+        if path.suffix.lower() == expected_suffix:
+            path = path.with_suffix("")
 
     # Ensure parent directory exists
     parent_dir = path.parent
@@ -1,6 +1,9 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
 
 from bpmn_print import console
 from . import bpmn_diagram
@@ -14,6 +17,10 @@ BPMN_EXTENSION = ".bpmn"
 PDF_EXTENSION = ".pdf"
 PNG_EXTENSION = ".png"
 
+# (bpmn_file, pdf_path, png_file) for one file; plain strings so a job is
+# cheap to send to a worker process
+ConversionJob = Tuple[str, str, str]
+
 
 @dataclass
 class ConversionConfig:
@@ -63,21 +70,126 @@ def convert_bpmn_to_pdf(config: ConversionConfig) -> None:
     )
     pdf.make(config.pdf_path, pdf_data, config.landscape_threshold)
 
-    # 4. Remove PNG file if not keeping it
-    if not config.keep_png and os.path.exists(config.png_file):
+    # 4. Remove PNG file if not keeping it; a missing file needs no
+    # separate exists() check, remove() reports it
+    if not config.keep_png:
         try:
             os.remove(config.png_file)
+        except FileNotFoundError:
+            pass
         except OSError as e:
             console.warning(
                 f"Could not remove PNG file {config.png_file}: {e}"
             )
 
 
+def _list_bpmn_files(input_folder: str) -> List[os.DirEntry]:
+    """List the BPMN files directly inside input_folder.
+
+    One scandir() pass reads names and file types together, so each
+    entry is neither re-joined into a path nor stat-ed separately. A
+    missing folder yields no files, as the previous glob() did.
+    """
+    try:
+        with os.scandir(input_folder) as entries:
+            return [
+                entry
+                for entry in entries
+                if entry.name.endswith(BPMN_EXTENSION) and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _build_jobs(
+    bpmn_files: Iterable[os.DirEntry], output_path: Path
+) -> List[ConversionJob]:
+    jobs = []
+    for entry in bpmn_files:
+        # Every listed name ends with BPMN_EXTENSION, so slicing it off
+        # gives the stem; replace() would also rewrite earlier ".bpmn"s
+        stem = entry.name[: -len(BPMN_EXTENSION)]
+        dest_pdf_path = output_path / f"{stem}{PDF_EXTENSION}"
+        png_file = dest_pdf_path.with_suffix(PNG_EXTENSION)
+        jobs.append((entry.path, str(dest_pdf_path), str(png_file)))
+    return jobs
+
+
+def _convert_one(
+    job: ConversionJob, keep_png: bool, landscape_threshold: int
+) -> None:
+    bpmn_file, pdf_path, png_file = job
+    convert_bpmn_to_pdf(
+        ConversionConfig(
+            bpmn_file=bpmn_file,
+            pdf_path=pdf_path,
+            png_file=png_file,
+            keep_png=keep_png,
+            landscape_threshold=landscape_threshold,
+        )
+    )
+
+
+def _log_processing(job: ConversionJob) -> None:
+    console.info(f"Processing {os.path.basename(job[0])}...")
+
+
+def _log_generated(job: ConversionJob) -> None:
+    console.info(f"✓ Generated {job[1]}")
+
+
+def _convert_all(
+    convert: Callable[[ConversionJob], None],
+    jobs: List[ConversionJob],
+    max_workers: Optional[int],
+) -> None:
+    """Run convert on every job, logging progress in input order.
+
+    Every file is independent (own parse, own dot process, own PDF), so
+    batches are spread over worker processes. A single file, or
+    max_workers=1, is converted in-process to skip the pool start-up.
+    Either way "Processing" is logged before a file's result is awaited,
+    so the last file named is the one that failed. Workers get the
+    parent's console level. After the first failure, jobs that have not
+    started are cancelled before the error is re-raised.
+    """
+    if len(jobs) == 1 or max_workers == 1:
+        for job in jobs:
+            _log_processing(job)
+            convert(job)
+            _log_generated(job)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=console.set_level,
+        initargs=(console.get_level(),),
+    ) as executor:
+        futures = [executor.submit(convert, job) for job in jobs]
+        try:
+            for job, future in zip(jobs, futures):
+                _log_processing(job)
+                try:
+                    future.result()
+                except Exception:
+                    # The worker's exception carries no note of which
+                    # input it came from
+                    console.warning(f"Failed to convert {job[0]}")
+                    raise
+                _log_generated(job)
+        finally:
+            # No-op once every job has finished; otherwise stops the queued
+            # ones so their PDFs are not written after an error
+            for future in futures:
+                future.cancel()
+
+
 def pretty_print(
     input_folder: str,
     output_folder: str,
     keep_png: bool = False,
     landscape_threshold: int = 2200,
+    max_workers: Optional[int] = None,
 ) -> None:
     output_path = Path(output_folder)
     # Create output folder with error handling
@@ -86,10 +198,9 @@ def pretty_print(
     except OSError as e:
         raise BpmnRenderError.output_dir_error(output_folder, str(e)) from e
 
-    input_path = Path(input_folder)
     # Collect BPMN files to process with error handling
     try:
-        bpmn_files = [f.name for f in input_path.glob(f"*{BPMN_EXTENSION}")]
+        bpmn_files = _list_bpmn_files(input_folder)
     except OSError as e:
         raise BpmnFileError.not_readable(input_folder, str(e)) from e
 
@@ -99,22 +210,12 @@ def pretty_print(
 
     console.info(f"Found {len(bpmn_files)} BPMN file(s) to process")
 
-    for file in bpmn_files:
-        console.info(f"Processing {file}...")
-        src_bpmn_file = str(input_path / file)
-        dest_pdf_path = output_path / file.replace(
-            BPMN_EXTENSION, PDF_EXTENSION
-        )
-        png_file = dest_pdf_path.with_suffix(PNG_EXTENSION)
-
-        config = ConversionConfig(
-            bpmn_file=src_bpmn_file,
-            pdf_path=str(dest_pdf_path),
-            png_file=str(png_file),
-            keep_png=keep_png,
-            landscape_threshold=landscape_threshold,
-        )
-        convert_bpmn_to_pdf(config)
-        console.info(f"✓ Generated {dest_pdf_path}")
+    convert = partial(
+        _convert_one,
+        keep_png=keep_png,
+        landscape_threshold=landscape_threshold,
+    )
+    jobs = _build_jobs(bpmn_files, output_path)
+    _convert_all(convert, jobs, max_workers)
 
     console.println("Done.")
@@ -1,6 +1,6 @@
 # BPMN and Camunda namespace mappings for XML parsing
 # These dictionaries map namespace prefixes to their official URIs.
-# Used with lxml's findall() and find() methods to query elements.
+# Used to build the Clark-notation tag names below.
 # Note: These are XML namespace identifiers, not actual HTTP endpoints.
 # The http:// URIs are defined by the BPMN/Camunda specifications and must
 # match exactly.
@@ -12,6 +12,8 @@ BPMN_NS = {
 # Individual namespace URIs for direct reference
 BPMN_NS_URI = BPMN_NS["bpmn"]
 CAMUNDA_NS_URI = BPMN_NS["camunda"]
+# Diagram interchange (layout) namespace; never queried by prefix
+BPMNDI_NS_URI = "http://www.omg.org/spec/BPMN/20100524/DI"  # NOSONAR
 
 # XML attribute names used across BPMN parsing
 ATTR_ID = "id"
@@ -20,19 +22,19 @@ ATTR_SOURCE_REF = "sourceRef"
 ATTR_TARGET_REF = "targetRef"
 ATTR_CALLED_ELEMENT = "calledElement"
 
-# XPath query patterns for BPMN elements
-# These require the BPMN namespace mapping when used with findall()/find()
-XPATH_ALL_WITH_ID = ".//*[@id]"
-XPATH_START_EVENT = ".//bpmn:startEvent"
-XPATH_END_EVENT = ".//bpmn:endEvent"
-XPATH_TASK = ".//bpmn:task"
-XPATH_SERVICE_TASK = ".//bpmn:serviceTask"
-XPATH_CALL_ACTIVITY = ".//bpmn:callActivity"
-XPATH_EXCLUSIVE_GATEWAY = ".//bpmn:exclusiveGateway"
-XPATH_PARALLEL_GATEWAY = ".//bpmn:parallelGateway"
-XPATH_SEQUENCE_FLOW = ".//bpmn:sequenceFlow"
-XPATH_CONDITION_EXPRESSION = ".//bpmn:conditionExpression"
-
-# XPath query patterns for Camunda extensions
-XPATH_CAMUNDA_SCRIPT = ".//camunda:script"
-XPATH_CAMUNDA_INPUT_PARAMETER = ".//camunda:inputParameter"
+# Clark-notation tag names ({namespace-uri}localName)
+# Used with lxml's iter() tag filter, which matches tags in C without
+# evaluating an XPath expression
+TAG_PROCESS = f"{{{BPMN_NS_URI}}}process"
+TAG_BPMN_DIAGRAM = f"{{{BPMNDI_NS_URI}}}BPMNDiagram"
+TAG_START_EVENT = f"{{{BPMN_NS_URI}}}startEvent"
+TAG_END_EVENT = f"{{{BPMN_NS_URI}}}endEvent"
+TAG_TASK = f"{{{BPMN_NS_URI}}}task"
+TAG_SERVICE_TASK = f"{{{BPMN_NS_URI}}}serviceTask"
+TAG_CALL_ACTIVITY = f"{{{BPMN_NS_URI}}}callActivity"
+TAG_EXCLUSIVE_GATEWAY = f"{{{BPMN_NS_URI}}}exclusiveGateway"
+TAG_PARALLEL_GATEWAY = f"{{{BPMN_NS_URI}}}parallelGateway"
+TAG_SEQUENCE_FLOW = f"{{{BPMN_NS_URI}}}sequenceFlow"
+TAG_CONDITION_EXPRESSION = f"{{{BPMN_NS_URI}}}conditionExpression"
+TAG_CAMUNDA_SCRIPT = f"{{{CAMUNDA_NS_URI}}}script"
+TAG_CAMUNDA_INPUT_PARAMETER = f"{{{CAMUNDA_NS_URI}}}inputParameter"
@@ -1,3 +1,4 @@
+import pytest
 from lxml import etree
 from unittest.mock import Mock
 
@@ -10,18 +11,18 @@ from bpmn_print.bpmn_data import (
     _get_element_name,
     _is_jexl_expression,
     _simplify_class_name,
-    _get_node_info,
     _create_parameter,
     _process_script_element,
     _process_text_content,
     _create_call_activity_node,
-    _extract_call_activities,
     _create_service_task_node,
-    _extract_service_tasks,
-    _extract_script_elements,
+    _create_script_element,
     _process_single_input_parameter,
-    _extract_input_parameters,
+    _process_input_parameter,
+    _find_owner_id,
+    _iter_process_elements,
     extract,
+    extract_stream,
     UNKNOWN_VALUE,
     DEFAULT_PARAM_NAME,
     JEXL_SCRIPT_PLACEHOLDER,
@@ -29,8 +30,12 @@ from bpmn_print.bpmn_data import (
     NODE_TYPE_SERVICE_TASK,
     CAMUNDA_CLASS_ATTR,
 )
-from bpmn_print.xml_utils import BpmnContext
-from bpmn_print.xml_constants import ATTR_ID, ATTR_NAME
+from bpmn_print.xml_utils import BpmnContext, build_id_to_name_mapping
+from bpmn_print.xml_constants import (
+    ATTR_NAME,
+    TAG_CAMUNDA_INPUT_PARAMETER,
+    TAG_CAMUNDA_SCRIPT,
+)
 
 
 class TestNode:
@@ -51,6 +56,20 @@ class TestNode:
 
         assert node1 == node2
 
+    def test_node_is_immutable_and_has_no_dict(self):
+        """Test that Node has no __dict__ and rejects attribute assignment."""
+        node = Node(name="Task", type="callActivity", target="subprocess")
+
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.name = "Other"
+
+    def test_node_unpacks_as_tuple(self):
+        """Test that Node supports tuple unpacking."""
+        name, node_type, target = Node("Task", "callActivity", "sub")
+
+        assert (name, node_type, target) == ("Task", "callActivity", "sub")
+
 
 class TestParameter:
     """Tests for Parameter dataclass."""
@@ -113,15 +132,19 @@ class TestBpmnExtractResult:
         assert result.parameters == parameters
         assert result.scripts == scripts
 
+    def test_result_unpacks_as_tuple(self):
+        """Test unpacking a BpmnExtractResult into its three lists."""
+        nodes, parameters, scripts = BpmnExtractResult([], [], [])
+
+        assert (nodes, parameters, scripts) == ([], [], [])
+
 
 class TestFindParentWithId:
     """Tests for find_parent_with_id function."""
 
     def test_returns_id_when_element_has_id(self):
         """Test finding ID on the element itself."""
-        element = Mock()
-        element.attrib = {"id": "Task_123"}
-        element.get = lambda key: element.attrib.get(key)
+        element = etree.fromstring('<task id="Task_123"/>')
 
         result = find_parent_with_id(element)
 
@@ -129,50 +152,39 @@ class TestFindParentWithId:
 
     def test_returns_parent_id_when_element_has_no_id(self):
         """Test finding ID on parent element."""
-        parent = Mock()
-        parent.attrib = {"id": "Parent_456"}
-        parent.get = lambda key: parent.attrib.get(key)
-        parent.getparent.return_value = None
-
-        element = Mock()
-        element.attrib = {}
-        element.get = lambda key: element.attrib.get(key)
-        element.getparent.return_value = parent
+        parent = etree.fromstring('<task id="Parent_456"><child/></task>')
 
-        result = find_parent_with_id(element)
+        result = find_parent_with_id(parent[0])
 
         assert result == "Parent_456"
 
     def test_returns_unknown_when_no_ancestor_has_id(self):
         """Test returning UNKNOWN_VALUE when no ancestor has ID."""
-        element = Mock()
-        element.attrib = {}
-        element.getparent.return_value = None
+        root = etree.fromstring("<root><child/></root>")
 
-        result = find_parent_with_id(element)
+        result = find_parent_with_id(root[0])
 
         assert result == UNKNOWN_VALUE
 
     def test_traverses_multiple_levels(self):
         """Test traversing multiple parent levels."""
-        grandparent = Mock()
-        grandparent.attrib = {"id": "GP_789"}
-        grandparent.get = lambda key: grandparent.attrib.get(key)
-        grandparent.getparent.return_value = None
+        grandparent = etree.fromstring(
+            '<task id="GP_789"><parent><element/></parent></task>'
+        )
 
-        parent = Mock()
-        parent.attrib = {}
-        parent.get = lambda key: parent.attrib.get(key)
-        parent.getparent.return_value = grandparent
+        result = find_parent_with_id(grandparent[0][0])
 
-        element = Mock()
-        element.attrib = {}
-        element.get = lambda key: element.attrib.get(key)
-        element.getparent.return_value = parent
+        assert result == "GP_789"
 
-        result = find_parent_with_id(element)
+    def test_returns_nearest_id(self):
+        """Test that the closest ancestor with an ID wins."""
+        root = etree.fromstring(
+            '<process id="P"><task id="T"><element/></task></process>'
+        )
 
-        assert result == "GP_789"
+        result = find_parent_with_id(root[0][0])
+
+        assert result == "T"
 
 
 class TestGetElementName:
@@ -180,54 +192,36 @@ class TestGetElementName:
 
     def test_returns_name_when_present(self):
         """Test returning name attribute when present."""
-        element = Mock()
-
-        def mock_get(key, default=UNKNOWN_VALUE):
-            if key == ATTR_NAME:
-                return "Task Name"
-            elif key == ATTR_ID:
-                return "task_123"
-            else:
-                return default
+        element = etree.fromstring(b'<task id="task_123" name="Task Name"/>')
 
-        element.get.side_effect = mock_get
+        assert _get_element_name(element) == "Task Name"
 
-        result = _get_element_name(element)
+    def test_does_not_read_id_when_named(self):
+        """Test that the ID attribute is not read for a named element."""
+        element = Mock()
+        element.get.return_value = "Task Name"
 
-        assert result == "Task Name"
+        assert _get_element_name(element) == "Task Name"
+        element.get.assert_called_once_with(ATTR_NAME)
 
     def test_returns_id_when_name_missing(self):
         """Test returning ID when name is missing."""
-        element = Mock()
-
-        def mock_get(key, default=UNKNOWN_VALUE):
-            if key == ATTR_NAME:
-                return "task_123"  # First call returns ID as fallback
-            return default
+        element = etree.fromstring(b'<task id="task_123"/>')
 
-        element.get.side_effect = mock_get
+        assert _get_element_name(element) == "task_123"
 
-        result = _get_element_name(element)
+    def test_keeps_empty_name(self):
+        """Test that an explicit empty name does not fall back to ID."""
+        element = etree.fromstring(b'<task id="task_123" name=""/>')
 
-        assert result == "task_123"
+        assert _get_element_name(element) == ""
 
     def test_returns_default_when_name_and_id_missing(self):
         """Test returning default when both name and ID are missing."""
-        element = Mock()
-        element.get.return_value = "custom_default"
+        element = etree.fromstring(b"<task/>")
 
-        result = _get_element_name(element, default="custom_default")
-
-        assert result == "custom_default"
-
-    def test_returns_unknown_by_default(self):
-        """Test returning UNKNOWN_VALUE as default."""
-        element = Mock()
-        element.get.return_value = UNKNOWN_VALUE
-
-        result = _get_element_name(element)
-
-        assert result == UNKNOWN_VALUE
+        assert _get_element_name(element) == UNKNOWN_VALUE
+        assert _get_element_name(element, "custom") == "custom"
 
 
 class TestIsJexlExpression:
@@ -264,6 +258,16 @@ class TestIsJexlExpression:
         assert _is_jexl_expression("${ test}") is True
         assert _is_jexl_expression("#{test}") is False  # no space
 
+    def test_accepts_any_whitespace_after_brace(self):
+        """Test that tabs and newlines also mark a JEXL expression."""
+        assert _is_jexl_expression("${\ttest}") is True
+        assert _is_jexl_expression("#{\n test }") is True
+
+    def test_returns_false_for_brace_without_marker(self):
+        """Test that a brace without a leading $ or # is not JEXL."""
+        assert _is_jexl_expression("{ test }") is False
+        assert _is_jexl_expression("$ {test}") is False
+
 
 class TestSimplifyClassName:
     """Tests for _simplify_class_name function."""
@@ -292,62 +296,90 @@ class TestSimplifyClassName:
 
         assert result == "Class"
 
+    def test_handles_trailing_dot(self):
+        """Test that a trailing dot yields an empty simple name."""
+        result = _simplify_class_name("com.example.")
 
-class TestGetNodeInfo:
-    """Tests for _get_node_info function."""
+        assert result == ""
 
-    def test_returns_node_name_and_param_name(self):
-        """Test extracting node name and parameter name."""
-        parent = Mock()
-        parent.attrib = {"id": "Task_123"}
-        parent.get = lambda key: parent.attrib.get(key)
-        parent.getparent.return_value = None
+    def test_reuses_cached_result(self):
+        """Test that repeated class names are served from the cache."""
+        _simplify_class_name.cache_clear()
 
-        element = Mock()
-        element.attrib = {}
-        element.get = lambda key, default=None: (
-            "param1" if key == ATTR_NAME else default
-        )
-        element.getparent.return_value = parent
+        first = _simplify_class_name("com.example.SharedDelegate")
+        second = _simplify_class_name("com.example.SharedDelegate")
 
-        id_to_name = {"Task_123": "My Task"}
+        assert first is second
+        assert _simplify_class_name.cache_info().hits == 1
 
-        node_name, param_name = _get_node_info(element, id_to_name)
 
-        assert node_name == "My Task"
-        assert param_name == "param1"
+class TestFindOwnerId:
+    """Tests for _find_owner_id function."""
 
-    def test_uses_id_when_name_not_in_mapping(self):
-        """Test using ID when not found in mapping."""
-        element = Mock()
-        element.attrib = {"id": "Task_999"}
-        element.get = lambda key, default=None: (
-            "param1" if key == ATTR_NAME else element.attrib.get(key, default)
-        )
-        element.getparent.return_value = None
+    XML = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL"
+             xmlns:camunda="http://camunda.org/schema/1.0/bpmn">
+    <process id="Process_1">
+        <serviceTask id="Task_1" name="My Task">
+            <extensionElements>
+                <camunda:inputOutput>
+                    <camunda:inputParameter name="param1">
+                        <camunda:script>print('hello')</camunda:script>
+                    </camunda:inputParameter>
+                    <camunda:inputParameter id="Param_2" name="param2"
+                    >value2</camunda:inputParameter>
+                </camunda:inputOutput>
+            </extensionElements>
+        </serviceTask>
+    </process>
+</definitions>"""
 
-        id_to_name = {}
+    def test_finds_nearest_ancestor_id(self):
+        """Test resolving scripts and parameters to the owning node ID."""
+        root = etree.fromstring(self.XML.encode())
+        inputs = list(root.iter(TAG_CAMUNDA_INPUT_PARAMETER))
+        scr = next(root.iter(TAG_CAMUNDA_SCRIPT))
+        owner_ids = {}
 
-        node_name, param_name = _get_node_info(element, id_to_name)
+        assert _find_owner_id(scr, owner_ids) == "Task_1"
+        assert _find_owner_id(inputs[0], owner_ids) == "Task_1"
 
-        assert node_name == "Task_999"
-        assert param_name == "param1"
+    def test_uses_own_id_when_present(self):
+        """Test element with its own ID resolves to itself."""
+        root = etree.fromstring(self.XML.encode())
+        inputs = list(root.iter(TAG_CAMUNDA_INPUT_PARAMETER))
 
-    def test_uses_default_param_name(self):
-        """Test using default parameter name."""
-        element = Mock()
-        element.attrib = {"id": "Task_123"}
-        element.get = lambda key, default=None: (
-            default if key == ATTR_NAME else element.attrib.get(key)
-        )
-        element.getparent.return_value = None
+        assert _find_owner_id(inputs[1], {}) == "Param_2"
 
-        id_to_name = {"Task_123": "My Task"}
+    def test_returns_unknown_when_no_ancestor_has_id(self):
+        """Test UNKNOWN_VALUE when no ancestor has an ID."""
+        xml_content = """<camunda:inputParameter
+            xmlns:camunda="http://camunda.org/schema/1.0/bpmn"
+            name="param1">value</camunda:inputParameter>"""
+        root = etree.fromstring(xml_content.encode())
 
-        node_name, param_name = _get_node_info(element, id_to_name)
+        assert _find_owner_id(root, {}) == UNKNOWN_VALUE
 
-        assert node_name == "My Task"
-        assert param_name == DEFAULT_PARAM_NAME
+    def test_caches_every_element_on_the_path(self):
+        """Test that visited elements are memoised for later lookups."""
+        root = etree.fromstring(self.XML.encode())
+        scr = next(root.iter(TAG_CAMUNDA_SCRIPT))
+        owner_ids = {}
+
+        _find_owner_id(scr, owner_ids)
+
+        # script, inputParameter, inputOutput, extensionElements, task
+        assert len(owner_ids) == 5
+        assert set(owner_ids.values()) == {"Task_1"}
+
+    def test_resolves_from_cache(self):
+        """Test that a cached ancestor short-circuits the walk."""
+        root = etree.fromstring(self.XML.encode())
+        inputs = list(root.iter(TAG_CAMUNDA_INPUT_PARAMETER))
+        owner_ids = {inputs[0]: "Cached_1"}
+        scr = next(root.iter(TAG_CAMUNDA_SCRIPT))
+
+        assert _find_owner_id(scr, owner_ids) == "Cached_1"
 
 
 class TestCreateParameter:
@@ -428,7 +460,7 @@ class TestCreateCallActivityNode:
     def test_handles_missing_name(self):
         """Test handling missing name attribute."""
         element = Mock()
-        element.get.side_effect = lambda key, default="": {
+        element.get.side_effect = lambda key, default=None: {
             "id": "CallActivity_1",
             "calledElement": "subprocess_id",
         }.get(key, default)
@@ -437,9 +469,28 @@ class TestCreateCallActivityNode:
 
         assert node.name == "CallActivity_1"
 
+    def test_keeps_empty_name(self):
+        """Test that an explicit empty name is kept, not replaced by ID."""
+        element = etree.fromstring(
+            b'<callActivity id="CallActivity_1" name=""/>'
+        )
+
+        node = _create_call_activity_node(element)
+
+        assert node.name == ""
+
+    def test_returns_unknown_when_name_and_id_missing(self):
+        """Test UNKNOWN_VALUE when both name and ID are missing."""
+        element = etree.fromstring(b"<callActivity/>")
+
+        node = _create_call_activity_node(element)
+
+        assert node.name == UNKNOWN_VALUE
+        assert node.target == ""
+
 
 class TestExtractCallActivities:
-    """Tests for _extract_call_activities function."""
+    """Tests for callActivity extraction in extract."""
 
     def test_extracts_all_call_activities(self):
         """Test extracting all callActivity elements."""
@@ -454,7 +505,7 @@ class TestExtractCallActivities:
 </definitions>"""
         root = etree.fromstring(xml_content.encode())
 
-        nodes = _extract_call_activities(root)
+        nodes = extract(BpmnContext(root=root, id_to_name={})).nodes
 
         assert len(nodes) == 2
         assert nodes[0].name == "Subprocess 1"
@@ -472,7 +523,7 @@ class TestExtractCallActivities:
 </definitions>"""
         root = etree.fromstring(xml_content.encode())
 
-        nodes = _extract_call_activities(root)
+        nodes = extract(BpmnContext(root=root, id_to_name={})).nodes
 
         assert len(nodes) == 0
 
@@ -508,9 +559,17 @@ class TestCreateServiceTaskNode:
 
         assert node.target == ""
 
+    def test_uses_id_when_name_missing(self):
+        """Test falling back to the ID when the name is missing."""
+        element = etree.fromstring(b'<serviceTask id="ServiceTask_1"/>')
+
+        node = _create_service_task_node(element)
+
+        assert node.name == "ServiceTask_1"
+
 
 class TestExtractServiceTasks:
-    """Tests for _extract_service_tasks function."""
+    """Tests for serviceTask extraction in extract."""
 
     def test_extracts_all_service_tasks(self):
         """Test extracting all serviceTask elements."""
@@ -526,7 +585,7 @@ class TestExtractServiceTasks:
 </definitions>"""
         root = etree.fromstring(xml_content.encode())
 
-        nodes = _extract_service_tasks(root)
+        nodes = extract(BpmnContext(root=root, id_to_name={})).nodes
 
         assert len(nodes) == 2
         assert nodes[0].name == "Service 1"
@@ -534,9 +593,25 @@ class TestExtractServiceTasks:
         assert nodes[1].name == "Service 2"
         assert nodes[1].target == "Service2"
 
+    def test_shares_repeated_targets(self):
+        """Test that repeated delegate classes share one string object."""
+        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL"
+             xmlns:camunda="http://camunda.org/schema/1.0/bpmn">
+    <process id="Process_1">
+        <serviceTask id="ServiceTask_1" camunda:class="com.example.Common"/>
+        <serviceTask id="ServiceTask_2" camunda:class="com.example.Common"/>
+    </process>
+</definitions>"""
+        root = etree.fromstring(xml_content.encode())
 
-class TestExtractScriptElements:
-    """Tests for _extract_script_elements function."""
+        nodes = extract(BpmnContext(root=root, id_to_name={})).nodes
+
+        assert nodes[0].target is nodes[1].target
+
+
+class TestCreateScriptElement:
+    """Tests for _create_script_element function."""
 
     def test_extracts_script_elements(self):
         """Test extracting script elements."""
@@ -558,12 +633,13 @@ class TestExtractScriptElements:
         root = etree.fromstring(xml_content.encode())
         id_to_name = {"Task_1": "My Task"}
 
-        scripts = _extract_script_elements(root, id_to_name)
+        scr = next(root.iter(TAG_CAMUNDA_SCRIPT))
 
-        assert len(scripts) == 1
-        assert scripts[0].text == "print('hello')"
-        assert scripts[0].node_name == "My Task"
-        assert scripts[0].param_name == "param1"
+        script = _create_script_element(scr, "Task_1", id_to_name)
+
+        assert script.text == "print('hello')"
+        assert script.node_name == "My Task"
+        assert script.param_name == "param1"
 
     def test_handles_empty_script_text(self):
         """Test handling script element with no text."""
@@ -585,10 +661,11 @@ class TestExtractScriptElements:
         root = etree.fromstring(xml_content.encode())
         id_to_name = {"Task_1": "Task 1"}
 
-        scripts = _extract_script_elements(root, id_to_name)
+        scr = next(root.iter(TAG_CAMUNDA_SCRIPT))
 
-        assert len(scripts) == 1
-        assert scripts[0].text == ""
+        script = _create_script_element(scr, "Task_1", id_to_name)
+
+        assert script.text == ""
 
 
 class TestProcessSingleInputParameter:
@@ -611,6 +688,33 @@ class TestProcessSingleInputParameter:
         assert param.has_script is True
         assert script is None
 
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "<camunda:list><camunda:value><camunda:script>a()"
+            "</camunda:script></camunda:value></camunda:list>",
+            '<camunda:map><camunda:entry key="k"><camunda:script>b()'
+            "</camunda:script></camunda:entry></camunda:map>",
+        ],
+        ids=["list", "map"],
+    )
+    def test_processes_script_nested_in_list_or_map(self, body):
+        """Test that scripts inside camunda:list/map are still found."""
+        xml_content = (
+            '<camunda:inputParameter xmlns:camunda="'
+            'http://camunda.org/schema/1.0/bpmn" name="param1">'
+            f"{body}</camunda:inputParameter>"
+        )
+        element = etree.fromstring(xml_content.encode())
+
+        param, script = _process_single_input_parameter(
+            element, "Task1", "param1"
+        )
+
+        assert param.value == JEXL_SCRIPT_PLACEHOLDER
+        assert param.has_script is True
+        assert script is None
+
     def test_processes_parameter_with_jexl_text(self):
         """Test processing parameter with JEXL expression text."""
         xml_content = """<?xml version="1.0" encoding="UTF-8"?>
@@ -658,7 +762,7 @@ class TestProcessSingleInputParameter:
 
 
 class TestExtractInputParameters:
-    """Tests for _extract_input_parameters function."""
+    """Tests for inputParameter extraction in extract."""
 
     def test_extracts_multiple_parameters(self):
         """Test extracting multiple input parameters."""
@@ -681,7 +785,8 @@ class TestExtractInputParameters:
         root = etree.fromstring(xml_content.encode())
         id_to_name = {"Task_1": "My Task"}
 
-        parameters, scripts = _extract_input_parameters(root, id_to_name)
+        result = extract(BpmnContext(root=root, id_to_name=id_to_name))
+        parameters, scripts = result.parameters, result.scripts
 
         assert len(parameters) == 2
         assert parameters[0].param_name == "param1"
@@ -711,7 +816,8 @@ class TestExtractInputParameters:
         root = etree.fromstring(xml_content.encode())
         id_to_name = {"Task_1": "My Task"}
 
-        parameters, scripts = _extract_input_parameters(root, id_to_name)
+        result = extract(BpmnContext(root=root, id_to_name=id_to_name))
+        parameters, scripts = result.parameters, result.scripts
 
         assert len(parameters) == 2
         assert parameters[0].has_script is False
@@ -721,6 +827,87 @@ class TestExtractInputParameters:
         assert scripts[0].text == "${ jexl }"
 
 
+class TestProcessInputParameter:
+    """Tests for _process_input_parameter function."""
+
+    def test_resolves_node_name_from_ancestor(self):
+        """Test resolving the owning node name of a parameter."""
+        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL"
+             xmlns:camunda="http://camunda.org/schema/1.0/bpmn">
+    <process id="Process_1">
+        <serviceTask id="Task_1" name="My Task">
+            <extensionElements>
+                <camunda:inputOutput>
+                    <camunda:inputParameter name="param1"
+                    >value1</camunda:inputParameter>
+                </camunda:inputOutput>
+            </extensionElements>
+        </serviceTask>
+    </process>
+</definitions>"""
+        root = etree.fromstring(xml_content.encode())
+        inp = next(root.iter(TAG_CAMUNDA_INPUT_PARAMETER))
+
+        param, script = _process_input_parameter(
+            inp, "Task_1", {"Task_1": "My Task"}
+        )
+
+        assert param == Parameter("My Task", "param1", "value1", False)
+        assert script is None
+
+    def test_falls_back_to_owner_id_and_default_param_name(self):
+        """Test fallbacks for an unmapped owner and an unnamed parameter."""
+        inp = etree.fromstring(
+            b'<inputParameter xmlns="http://camunda.org/schema/1.0/bpmn"'
+            b">value1</inputParameter>"
+        )
+
+        param, script = _process_input_parameter(inp, "Task_999", {})
+
+        assert param == Parameter(
+            "Task_999", DEFAULT_PARAM_NAME, "value1", False
+        )
+        assert script is None
+
+
+class TestIterProcessElements:
+    """Tests for _iter_process_elements function."""
+
+    def test_only_searches_process_subtrees(self):
+        """Test that elements outside bpmn:process are not visited."""
+        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL"
+             xmlns:bpmndi="http://www.omg.org/spec/BPMN/20100524/DI">
+    <process id="Process_1">
+        <callActivity id="CallActivity_1"/>
+    </process>
+    <process id="Process_2">
+        <serviceTask id="ServiceTask_1"/>
+    </process>
+    <bpmndi:BPMNDiagram id="Diagram_1">
+        <callActivity id="Stray_1"/>
+    </bpmndi:BPMNDiagram>
+</definitions>"""
+        root = etree.fromstring(xml_content.encode())
+
+        ids = [e.get("id") for e in _iter_process_elements(root)]
+
+        assert ids == ["CallActivity_1", "ServiceTask_1"]
+
+    def test_accepts_process_as_root(self):
+        """Test iterating when the root element is a process."""
+        xml_content = """<process id="Process_1"
+            xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL">
+    <callActivity id="CallActivity_1"/>
+</process>"""
+        root = etree.fromstring(xml_content.encode())
+
+        ids = [e.get("id") for e in _iter_process_elements(root)]
+
+        assert ids == ["CallActivity_1"]
+
+
 class TestExtract:
     """Tests for extract function."""
 
@@ -816,3 +1003,121 @@ class TestExtract:
         assert len(result.scripts) == 2
         assert any(s.text == "standalone_script" for s in result.scripts)
         assert any(s.text == "${ inline_jexl }" for s in result.scripts)
+
+    def test_keeps_call_activities_before_service_tasks(self):
+        """Test node order does not depend on document order."""
+        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL"
+             xmlns:camunda="http://camunda.org/schema/1.0/bpmn">
+    <process id="Process_1">
+        <serviceTask id="ServiceTask_1" name="Service"
+                     camunda:class="com.example.MyService"/>
+        <callActivity id="CallActivity_1" name="Subprocess"
+                      calledElement="sub1"/>
+    </process>
+</definitions>"""
+        root = etree.fromstring(xml_content.encode())
+        context = BpmnContext(root=root, id_to_name={})
+
+        result = extract(context)
+
+        assert [n.type for n in result.nodes] == [
+            NODE_TYPE_CALL_ACTIVITY,
+            NODE_TYPE_SERVICE_TASK,
+        ]
+
+    def test_keeps_script_elements_before_inline_jexl(self):
+        """Test script elements precede inline JEXL scripts."""
+        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL"
+             xmlns:camunda="http://camunda.org/schema/1.0/bpmn">
+    <process id="Process_1">
+        <serviceTask id="Task_1" name="My Task">
+            <extensionElements>
+                <camunda:inputOutput>
+                    <camunda:inputParameter name="jexl_param"
+                    >${ inline_jexl }</camunda:inputParameter>
+                    <camunda:inputParameter name="script_param">
+                        <camunda:script>standalone_script</camunda:script>
+                    </camunda:inputParameter>
+                </camunda:inputOutput>
+            </extensionElements>
+        </serviceTask>
+    </process>
+</definitions>"""
+        root = etree.fromstring(xml_content.encode())
+        context = BpmnContext(root=root, id_to_name={"Task_1": "My Task"})
+
+        result = extract(context)
+
+        assert [s.text for s in result.scripts] == [
+            "standalone_script",
+            "${ inline_jexl }",
+        ]
+
+
+class TestExtractStream:
+    """Tests for extract_stream function."""
+
+    def _stream(self, xml):
+        root = etree.fromstring(xml.encode())
+        context = BpmnContext(
+            root=root, id_to_name=build_id_to_name_mapping(root)
+        )
+        events = []
+        extract_stream(
+            context,
+            lambda node: events.append(("node", node)),
+            lambda param: events.append(("param", param)),
+            lambda script: events.append(("script", script)),
+        )
+        return events
+
+    def test_emits_records_in_document_order(self):
+        """Test that records reach the callbacks in document order."""
+        xml = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL"
+             xmlns:camunda="http://camunda.org/schema/1.0/bpmn">
+    <process id="Process_1">
+        <serviceTask id="Task_1" name="Service" camunda:class="a.B">
+            <extensionElements>
+                <camunda:inputOutput>
+                    <camunda:inputParameter name="p"
+                    >${ x }</camunda:inputParameter>
+                </camunda:inputOutput>
+            </extensionElements>
+        </serviceTask>
+        <callActivity id="Call_1" name="Call" calledElement="sub"/>
+    </process>
+</definitions>"""
+        events = self._stream(xml)
+
+        assert [kind for kind, _ in events] == [
+            "node",
+            "param",
+            "script",
+            "node",
+        ]
+        assert events[0][1].name == "Service"
+        assert events[1][1].param_name == "p"
+        assert events[1][1].has_script is True
+        assert events[2][1] == Script("${ x }", "Service", "p")
+        assert events[3][1].name == "Call"
+
+    def test_matches_extract(self):
+        """Test that streamed records are the same as extract() results."""
+        xml = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL">
+    <process id="Process_1">
+        <serviceTask id="Task_1" name="Service"/>
+        <callActivity id="Call_1" name="Call" calledElement="sub"/>
+    </process>
+</definitions>"""
+        root = etree.fromstring(xml.encode())
+        context = BpmnContext(
+            root=root, id_to_name=build_id_to_name_mapping(root)
+        )
+        result = extract(context)
+        nodes = [record for kind, record in self._stream(xml)]
+
+        assert sorted(nodes) == sorted(result.nodes)
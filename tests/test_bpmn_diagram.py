@@ -2,22 +2,20 @@ import pytest
 import warnings
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
+from lxml import etree
+
+from bpmn_print import bpmn_data
 from bpmn_print.bpmn_diagram import (
     _get_node_name,
     _create_bpmn_node,
-    _extract_nodes_by_type,
-    _extract_all_nodes,
-    _extract_all_edges,
-    _validate_node_ids,
+    _create_bpmn_edge,
+    _extract_nodes_and_edges,
     _validate_edge_references,
     build_model,
     _create_graph,
     _render_nodes,
-    _render_edge_with_condition,
-    _render_edge_with_label,
-    _render_plain_edge,
     _render_edges,
     render_model,
     render,
@@ -25,8 +23,7 @@ from bpmn_print.bpmn_diagram import (
 )
 from bpmn_print.diagram_model import BpmnNode, BpmnEdge, BpmnDiagramModel
 from bpmn_print.errors import BpmnRenderError
-from bpmn_print.xml_constants import BPMN_NS
-from bpmn_print.xml_utils import create_bpmn_context
+from bpmn_print.xml_utils import BpmnContext, create_bpmn_context
 
 
 class TestGetNodeName:
@@ -60,6 +57,23 @@ class TestGetNodeName:
 
         assert result == "node_id_123"
 
+    def test_empty_name_matches_data_tables(self):
+        """Test that name="" stays empty in both diagram and tables."""
+        xml = b"""<definitions
+            xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL">
+    <process id="Process_1">
+        <callActivity id="Call_1" name="" calledElement="sub"/>
+    </process>
+</definitions>"""
+        root = etree.fromstring(xml)
+        context = BpmnContext(root=root, id_to_name={})
+
+        diagram_node = build_model(context).nodes[0]
+        table_node = bpmn_data.extract(context).nodes[0]
+
+        assert diagram_node.name == ""
+        assert table_node.name == ""
+
 
 class TestCreateBpmnNode:
     """Tests for _create_bpmn_node function."""
@@ -93,259 +107,256 @@ class TestCreateBpmnNode:
         assert node.node_type == "startEvent"
 
 
-class TestExtractNodesByType:
-    """Tests for _extract_nodes_by_type function."""
+class TestExtractNodesAndEdges:
+    """Tests for _extract_nodes_and_edges function."""
+
+    def _root(self, body):
+        xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL">
+    <process id="Process_1">
+{body}
+    </process>
+</definitions>"""
+        return etree.fromstring(xml.encode())
 
     def test_extracts_multiple_nodes(self):
         """Test extracting multiple nodes of the same type."""
-        root = Mock()
-        element1 = Mock()
-        element1.get.side_effect = lambda attr, default=None: {
-            "id": "task_1",
-            "name": "Task A",
-        }.get(attr, default)
+        root = self._root("""        <task id="task_1" name="Task A"/>
+        <task id="task_2" name="Task B"/>""")
 
-        element2 = Mock()
-        element2.get.side_effect = lambda attr, default=None: {
-            "id": "task_2",
-            "name": "Task B",
-        }.get(attr, default)
-
-        root.findall.return_value = [element1, element2]
-
-        config = {"xpath": ".//bpmn:task", "default_name": None}
-        nodes = _extract_nodes_by_type(root, BPMN_NS, "task", config)
+        nodes, edges, _ = _extract_nodes_and_edges(root)
 
         assert len(nodes) == 2
         assert nodes[0].node_id == "task_1"
         assert nodes[0].name == "Task A"
         assert nodes[1].node_id == "task_2"
         assert nodes[1].name == "Task B"
+        assert edges == []
 
-    def test_extracts_empty_list_when_no_nodes_found(self):
-        """Test returns empty list when no nodes found."""
-        root = Mock()
-        root.findall.return_value = []
-
-        config = {"xpath": ".//bpmn:task", "default_name": None}
-        nodes = _extract_nodes_by_type(root, BPMN_NS, "task", config)
+    def test_extracts_empty_lists_when_nothing_found(self):
+        """Test returns empty lists when no nodes or flows found."""
+        nodes, edges, _ = _extract_nodes_and_edges(self._root(""))
 
         assert nodes == []
-
-
-class TestExtractAllNodes:
-    """Tests for _extract_all_nodes function."""
+        assert edges == []
 
     def test_extracts_nodes_from_all_types(self):
         """Test that nodes from all types are extracted."""
-        root = Mock()
-
-        # Mock different elements for different node types
-        start_elem = Mock()
-        start_elem.get.side_effect = lambda attr, default=None: {
-            "id": "start_1"
-        }.get(attr, default)
-
-        task_elem = Mock()
-        task_elem.get.side_effect = lambda attr, default=None: {
-            "id": "task_1",
-            "name": "Task",
-        }.get(attr, default)
-
-        end_elem = Mock()
-        end_elem.get.side_effect = lambda attr, default=None: {
-            "id": "end_1"
-        }.get(attr, default)
+        root = self._root("""        <endEvent id="end_1"/>
+        <task id="task_1" name="Task"/>
+        <startEvent id="start_1"/>""")
 
-        def mock_findall(xpath, ns):
-            if "startEvent" in xpath:
-                return [start_elem]
-            elif "endEvent" in xpath:
-                return [end_elem]
-            elif xpath.endswith("task") or "task[" in xpath:
-                return [task_elem]
-            return []
+        nodes, _, _ = _extract_nodes_and_edges(root)
 
-        root.findall.side_effect = mock_findall
-
-        nodes = _extract_all_nodes(root, BPMN_NS)
-
-        assert len(nodes) >= 3
         node_ids = [n.node_id for n in nodes]
+        assert len(nodes) == 3
         assert "start_1" in node_ids
         assert "task_1" in node_ids
         assert "end_1" in node_ids
 
+    def test_groups_nodes_in_config_order(self):
+        """Test that nodes are grouped by type in NODE_TYPE_CONFIG order."""
+        root = self._root("""        <endEvent id="end_1"/>
+        <task id="task_1"/>
+        <startEvent id="start_1"/>
+        <task id="task_2"/>""")
 
-class TestExtractAllEdges:
-    """Tests for _extract_all_edges function."""
+        nodes, _, _ = _extract_nodes_and_edges(root)
 
-    def test_extracts_simple_edge_without_condition(self):
-        """Test extracting edge without condition."""
-        root = Mock()
-        flow = Mock()
-        flow.get.side_effect = lambda attr, default=None: {
-            "sourceRef": "task_1",
-            "targetRef": "task_2",
-            "name": "",
-        }.get(attr, default)
-        flow.find.return_value = None
+        assert [n.node_id for n in nodes] == [
+            "start_1",
+            "end_1",
+            "task_1",
+            "task_2",
+        ]
 
-        root.findall.return_value = [flow]
+    def test_applies_default_names(self):
+        """Test that per-type default names are applied."""
+        root = self._root("""        <startEvent id="start_1"/>
+        <task id="task_1"/>""")
 
-        edges = _extract_all_edges(root, BPMN_NS)
+        nodes, _, _ = _extract_nodes_and_edges(root)
 
-        assert len(edges) == 1
-        assert edges[0].source_id == "task_1"
-        assert edges[0].target_id == "task_2"
-        assert edges[0].label is None
-        assert edges[0].condition is None
-        assert edges[0].condition_number is None
-
-    def test_extracts_edge_with_name_label(self):
-        """Test extracting edge with name label."""
-        root = Mock()
-        flow = Mock()
-        flow.get.side_effect = lambda attr, default=None: {
-            "sourceRef": "task_1",
-            "targetRef": "task_2",
-            "name": "Flow Name",
-        }.get(attr, default)
-        flow.find.return_value = None
+        assert nodes[0].name == "Start"
+        assert nodes[1].name == "task_1"
 
-        root.findall.return_value = [flow]
+    def test_ignores_unrelated_elements(self):
+        """Test that elements outside NODE_TYPE_CONFIG are skipped."""
+        root = self._root("""        <userTask id="user_1"/>
+        <task id="task_1"/>""")
 
-        edges = _extract_all_edges(root, BPMN_NS)
+        nodes, _, _ = _extract_nodes_and_edges(root)
 
-        assert len(edges) == 1
-        assert edges[0].label == "Flow Name"
-        assert edges[0].condition is None
+        assert [n.node_id for n in nodes] == ["task_1"]
 
-    def test_extracts_edge_with_condition(self):
-        """Test extracting edge with condition expression."""
-        root = Mock()
-        flow = Mock()
-        flow.get.side_effect = lambda attr, default=None: {
-            "sourceRef": "gateway_1",
-            "targetRef": "task_1",
-            "name": "",
-        }.get(attr, default)
+    def test_edge_refs_share_node_id_objects(self):
+        """Test that node IDs and flow references are interned."""
+        root = self._root("""        <task id="task_1"/>
+        <task id="task_2"/>
+        <sequenceFlow id="f1" sourceRef="task_1" targetRef="task_2"/>""")
 
-        condition_elem = Mock()
-        condition_elem.text = "  ${amount > 1000}  "
-        flow.find.return_value = condition_elem
+        nodes, edges, _ = _extract_nodes_and_edges(root)
 
-        root.findall.return_value = [flow]
+        assert edges[0].source_id is nodes[0].node_id
+        assert edges[0].target_id is nodes[1].node_id
 
-        edges = _extract_all_edges(root, BPMN_NS)
+    def test_numbers_conditions_in_document_order(self):
+        """Test that condition numbers increment across flows."""
+        root = self._root(
+            """        <sequenceFlow id="f1" sourceRef="gw" targetRef="t1">
+            <conditionExpression>${x > 10}</conditionExpression>
+        </sequenceFlow>
+        <sequenceFlow id="f2" sourceRef="gw" targetRef="t2" name="plain"/>
+        <sequenceFlow id="f3" sourceRef="gw" targetRef="t3">
+            <conditionExpression>${x &lt;= 10}</conditionExpression>
+        </sequenceFlow>"""
+        )
 
-        assert len(edges) == 1
-        assert edges[0].condition == "${amount > 1000}"
-        assert edges[0].condition_number == CONDITION_START_NUMBER
-        assert edges[0].label == f"[{CONDITION_START_NUMBER}]"
+        _, edges, _ = _extract_nodes_and_edges(root)
 
-    def test_increments_condition_counter_for_multiple_conditions(self):
-        """Test that condition numbers increment correctly."""
-        root = Mock()
+        assert len(edges) == 3
+        assert edges[0].condition_number == 1
+        assert edges[0].label == "[1]"
+        assert edges[1].condition_number is None
+        assert edges[1].label == "plain"
+        assert edges[2].condition_number == 2
+        assert edges[2].label == "[2]"
+
+    def test_ignores_nested_condition_expression(self):
+        """Test that only a direct conditionExpression child counts."""
+        root = self._root(
+            """        <sequenceFlow id="f1" sourceRef="a" targetRef="b">
+            <extensionElements>
+                <conditionExpression>${nested}</conditionExpression>
+            </extensionElements>
+        </sequenceFlow>"""
+        )
 
-        flow1 = Mock()
-        flow1.get.side_effect = lambda attr, default=None: {
-            "sourceRef": "gateway_1",
-            "targetRef": "task_1",
-            "name": "",
-        }.get(attr, default)
-        condition_elem1 = Mock()
-        condition_elem1.text = "${x > 10}"
-        flow1.find.return_value = condition_elem1
-
-        flow2 = Mock()
-        flow2.get.side_effect = lambda attr, default=None: {
-            "sourceRef": "gateway_1",
-            "targetRef": "task_2",
-            "name": "",
-        }.get(attr, default)
-        condition_elem2 = Mock()
-        condition_elem2.text = "${x <= 10}"
-        flow2.find.return_value = condition_elem2
+        _, edges, _ = _extract_nodes_and_edges(root)
 
-        root.findall.return_value = [flow1, flow2]
+        assert edges[0].condition is None
 
-        edges = _extract_all_edges(root, BPMN_NS)
+    def test_returns_valid_node_ids(self):
+        """Test that the IDs of all extracted nodes are returned."""
+        root = self._root("""        <startEvent id="start_1"/>
+        <task id="task_1"/>
+        <sequenceFlow id="f1" sourceRef="start_1" targetRef="task_1"/>""")
 
-        assert len(edges) == 2
-        assert edges[0].condition_number == 1
-        assert edges[0].label == "[1]"
-        assert edges[1].condition_number == 2
-        assert edges[1].label == "[2]"
+        _, _, node_ids = _extract_nodes_and_edges(root)
 
-    def test_handles_empty_condition_element(self):
-        """Test that empty condition element is ignored."""
-        root = Mock()
-        flow = Mock()
-        flow.get.side_effect = lambda attr, default=None: {
-            "sourceRef": "task_1",
-            "targetRef": "task_2",
-            "name": "",
-        }.get(attr, default)
+        assert node_ids == {"start_1", "task_1"}
 
-        condition_elem = Mock()
-        condition_elem.text = None
-        flow.find.return_value = condition_elem
+    def test_warns_when_node_has_no_id(self):
+        """Test that nodes without an ID are warned about and skipped."""
+        root = self._root("""        <task name="Task Without ID"/>
+        <task id="task_1"/>
+        <task id="" name="Empty ID"/>""")
 
-        root.findall.return_value = [flow]
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            nodes, _, node_ids = _extract_nodes_and_edges(root)
 
-        edges = _extract_all_edges(root, BPMN_NS)
+        assert len(w) == 2
+        assert "missing or empty ID" in str(w[0].message)
+        assert "Task Without ID" in str(w[0].message)
+        assert "Empty ID" in str(w[1].message)
+        assert len(nodes) == 3
+        assert node_ids == {"task_1"}
 
-        assert len(edges) == 1
-        assert edges[0].condition is None
-        assert edges[0].condition_number is None
 
+class TestCreateBpmnEdge:
+    """Tests for _create_bpmn_edge function."""
 
-class TestValidateNodeIds:
-    """Tests for _validate_node_ids function."""
+    def _flow(self, attrs, condition_elem=None):
+        children = [] if condition_elem is None else [condition_elem]
+        flow = MagicMock()
+        flow.get.side_effect = lambda attr, default=None: attrs.get(
+            attr, default
+        )
+        flow.__len__.return_value = len(children)
+        flow.iterchildren.return_value = iter(children)
+        return flow
+
+    def test_creates_simple_edge_without_condition(self):
+        """Test creating edge without condition."""
+        flow = self._flow(
+            {"sourceRef": "task_1", "targetRef": "task_2", "name": ""}
+        )
 
-    def test_returns_all_valid_node_ids(self):
-        """Test that all valid node IDs are returned."""
-        nodes = [
-            BpmnNode("task_1", "Task 1", "task"),
-            BpmnNode("task_2", "Task 2", "task"),
-            BpmnNode("start_1", "Start", "startEvent"),
-        ]
+        edge = _create_bpmn_edge(flow, CONDITION_START_NUMBER)
+
+        assert edge.source_id == "task_1"
+        assert edge.target_id == "task_2"
+        assert edge.label is None
+        assert edge.condition is None
+        assert edge.condition_number is None
+
+    def test_creates_edge_with_name_label(self):
+        """Test creating edge with name label."""
+        flow = self._flow(
+            {
+                "sourceRef": "task_1",
+                "targetRef": "task_2",
+                "name": "Flow Name",
+            }
+        )
 
-        node_ids = _validate_node_ids(nodes)
+        edge = _create_bpmn_edge(flow, CONDITION_START_NUMBER)
 
-        assert node_ids == {"task_1", "task_2", "start_1"}
+        assert edge.label == "Flow Name"
+        assert edge.condition is None
 
-    def test_warns_when_node_has_no_id(self):
-        """Test that warning is issued for nodes with missing ID."""
-        nodes = [
-            BpmnNode("", "Task Without ID", "task"),
-            BpmnNode("task_1", "Task 1", "task"),
-        ]
+    def test_creates_edge_with_condition(self):
+        """Test creating edge with condition expression."""
+        condition_elem = Mock()
+        condition_elem.text = "  ${amount > 1000}  "
+        flow = self._flow(
+            {"sourceRef": "gateway_1", "targetRef": "task_1", "name": ""},
+            condition_elem,
+        )
 
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            node_ids = _validate_node_ids(nodes)
+        edge = _create_bpmn_edge(flow, CONDITION_START_NUMBER)
 
-            assert len(w) == 1
-            assert "missing or empty ID" in str(w[0].message)
-            assert "Task Without ID" in str(w[0].message)
+        assert edge.condition == "${amount > 1000}"
+        assert edge.condition_number == CONDITION_START_NUMBER
+        assert edge.label == f"[{CONDITION_START_NUMBER}]"
 
-        assert node_ids == {"task_1"}
+    def test_uses_given_condition_number(self):
+        """Test that the supplied condition number is used."""
+        condition_elem = Mock()
+        condition_elem.text = "${x <= 10}"
+        flow = self._flow(
+            {"sourceRef": "gateway_1", "targetRef": "task_2", "name": ""},
+            condition_elem,
+        )
 
-    def test_handles_none_node_id(self):
-        """Test handling of None as node_id."""
-        nodes = [
-            BpmnNode(None, "Task", "task"),
-        ]
+        edge = _create_bpmn_edge(flow, 2)
 
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            node_ids = _validate_node_ids(nodes)
+        assert edge.condition_number == 2
+        assert edge.label == "[2]"
 
-            assert len(w) == 1
+    def test_handles_empty_condition_element(self):
+        """Test that empty condition element is ignored."""
+        condition_elem = Mock()
+        condition_elem.text = None
+        flow = self._flow(
+            {"sourceRef": "task_1", "targetRef": "task_2", "name": ""},
+            condition_elem,
+        )
+
+        edge = _create_bpmn_edge(flow, CONDITION_START_NUMBER)
 
-        assert node_ids == set()
+        assert edge.condition is None
+        assert edge.condition_number is None
+
+    def test_skips_child_scan_for_childless_flow(self):
+        """Test that flows without children are not scanned."""
+        flow = self._flow({"sourceRef": "task_1", "targetRef": "task_2"})
+
+        edge = _create_bpmn_edge(flow, CONDITION_START_NUMBER)
+
+        flow.iterchildren.assert_not_called()
+        assert edge.condition is None
 
 
 class TestValidateEdgeReferences:
@@ -366,6 +377,22 @@ class TestValidateEdgeReferences:
 
             assert len(w) == 0
 
+    def test_warns_only_for_bad_edge_among_valid_ones(self):
+        """Test that one bad reference is reported once."""
+        edges = [
+            BpmnEdge("task_1", "task_2", None, None, None),
+            BpmnEdge("task_2", "ghost", None, None, None),
+            BpmnEdge("task_2", "end_1", None, None, None),
+        ]
+        node_ids = {"task_1", "task_2", "end_1"}
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            _validate_edge_references(edges, node_ids, {})
+
+            assert len(w) == 1
+            assert "ghost" in str(w[0].message)
+
     def test_warns_when_source_id_missing(self):
         """Test warning when edge has missing sourceRef."""
         edges = [BpmnEdge("", "task_2", None, None, None)]
@@ -501,16 +528,48 @@ class TestRenderNodes:
 
         assert graph.node.call_count == 2
 
+    def test_passes_only_style_attributes(self):
+        """Test that lookup-only config keys are not sent to Graphviz."""
+        graph = Mock()
+        model = BpmnDiagramModel(
+            nodes=[BpmnNode("start_1", "Start", "startEvent")],
+            edges=[],
+            id_to_name={},
+        )
+
+        _render_nodes(graph, model)
 
-class TestRenderEdgeWithCondition:
-    """Tests for _render_edge_with_condition function."""
+        args, kwargs = graph.node.call_args
+        assert args == ("start_1", "Start")
+        assert kwargs["shape"] == "circle"
+        assert "tag" not in kwargs
+        assert "default_name" not in kwargs
 
-    def test_renders_edge_with_condition_styling(self):
-        """Test edge with condition is rendered with proper styling."""
+
+class TestRenderEdges:
+    """Tests for _render_edges function."""
+
+    def _render(self, *edges):
         graph = Mock()
-        edge = BpmnEdge("gateway_1", "task_1", "[1]", "${x > 10}", 1)
+        model = BpmnDiagramModel(nodes=[], edges=list(edges), id_to_name={})
+        _render_edges(graph, model)
+        return graph
 
-        _render_edge_with_condition(graph, edge)
+    def test_renders_all_edge_types(self):
+        """Test that all edge types are rendered correctly."""
+        graph = self._render(
+            BpmnEdge("task_1", "task_2", "[1]", "${x}", 1),
+            BpmnEdge("task_2", "task_3", "Label", None, None),
+            BpmnEdge("task_3", "task_4", None, None, None),
+        )
+
+        assert graph.edge.call_count == 3
+
+    def test_renders_edge_with_condition_styling(self):
+        """Test edge with condition is rendered with proper styling."""
+        graph = self._render(
+            BpmnEdge("gateway_1", "task_1", "[1]", "${x > 10}", 1)
+        )
 
         graph.edge.assert_called_once()
         call_args = graph.edge.call_args
@@ -520,16 +579,11 @@ class TestRenderEdgeWithCondition:
         assert "fontsize" in call_args[1]
         assert "fontcolor" in call_args[1]
 
-
-class TestRenderEdgeWithLabel:
-    """Tests for _render_edge_with_label function."""
-
     def test_renders_edge_with_label(self):
         """Test edge with label is rendered correctly."""
-        graph = Mock()
-        edge = BpmnEdge("task_1", "task_2", "Next Step", None, None)
-
-        _render_edge_with_label(graph, edge)
+        graph = self._render(
+            BpmnEdge("task_1", "task_2", "Next Step", None, None)
+        )
 
         graph.edge.assert_called_once()
         call_args = graph.edge.call_args
@@ -537,42 +591,15 @@ class TestRenderEdgeWithLabel:
         assert call_args[0][1] == "task_2"
         assert call_args[1]["label"] == "Next Step"
         assert "fontsize" in call_args[1]
-
-
-class TestRenderPlainEdge:
-    """Tests for _render_plain_edge function."""
+        assert "fontcolor" not in call_args[1]
 
     def test_renders_plain_edge_without_label(self):
         """Test plain edge is rendered without label."""
-        graph = Mock()
-        edge = BpmnEdge("task_1", "task_2", None, None, None)
-
-        _render_plain_edge(graph, edge)
+        graph = self._render(BpmnEdge("task_1", "task_2", None, None, None))
 
         graph.edge.assert_called_once_with("task_1", "task_2")
 
 
-class TestRenderEdges:
-    """Tests for _render_edges function."""
-
-    def test_renders_all_edge_types(self):
-        """Test that all edge types are rendered correctly."""
-        graph = Mock()
-        model = BpmnDiagramModel(
-            nodes=[],
-            edges=[
-                BpmnEdge("task_1", "task_2", "[1]", "${x}", 1),
-                BpmnEdge("task_2", "task_3", "Label", None, None),
-                BpmnEdge("task_3", "task_4", None, None, None),
-            ],
-            id_to_name={},
-        )
-
-        _render_edges(graph, model)
-
-        assert graph.edge.call_count == 3
-
-
 class TestRenderModel:
     """Tests for render_model function."""
 
@@ -585,6 +612,7 @@ class TestRenderModel:
         with TemporaryDirectory() as tmpdir:
             output_path = Path(tmpdir) / "output.png"
             mock_graph = Mock()
+            mock_graph.pipe.return_value = b"PNG image"
             mock_create_graph.return_value = mock_graph
             mock_prepare_path.return_value = (
                 Path(tmpdir) / "output",
@@ -599,7 +627,13 @@ class TestRenderModel:
 
             render_model(model, str(output_path))
 
-            mock_graph.render.assert_called_once()
+            mock_graph.pipe.assert_called_once()
+            mock_graph.render.assert_not_called()
+            assert output_path.read_bytes() == b"PNG image"
+            # No intermediate DOT source is left behind
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == [
+                "output.png"
+            ]
 
     @patch("bpmn_print.bpmn_diagram._create_graph")
     @patch("bpmn_print.bpmn_diagram.prepare_output_path")
@@ -612,7 +646,7 @@ class TestRenderModel:
         with TemporaryDirectory() as tmpdir:
             output_path = Path(tmpdir) / "output.png"
             mock_graph = Mock()
-            mock_graph.render.side_effect = graphviz.ExecutableNotFound(
+            mock_graph.pipe.side_effect = graphviz.ExecutableNotFound(
                 "dot not found"
             )
             mock_create_graph.return_value = mock_graph
@@ -641,7 +675,7 @@ class TestRenderModel:
             mock_graph = Mock()
             # Create a proper CalledProcessError with correct signature:
             # CalledProcessError(returncode, cmd, output, stderr)
-            mock_graph.render.side_effect = graphviz.CalledProcessError(
+            mock_graph.pipe.side_effect = graphviz.CalledProcessError(
                 1, ["dot"], "stdout", "stderr"
             )
             mock_create_graph.return_value = mock_graph
@@ -667,7 +701,7 @@ class TestRenderModel:
         with TemporaryDirectory() as tmpdir:
             output_path = Path(tmpdir) / "output.png"
             mock_graph = Mock()
-            mock_graph.render.side_effect = RuntimeError(
+            mock_graph.pipe.side_effect = RuntimeError(
                 "Unexpected error occurred"
             )
             mock_create_graph.return_value = mock_graph
@@ -80,7 +80,9 @@ def test_run_with_valid_arguments(mock_pretty_print, monkeypatch):
 
     run()
 
-    mock_pretty_print.assert_called_once_with("/input", "/output", False, 2200)
+    mock_pretty_print.assert_called_once_with(
+        "/input", "/output", False, 2200, None
+    )
 
 
 @patch("bpmn_print.cli.pretty_print")
@@ -93,7 +95,9 @@ def test_run_with_keep_flag_short(mock_pretty_print, monkeypatch):
 
     run()
 
-    mock_pretty_print.assert_called_once_with("/input", "/output", True, 2200)
+    mock_pretty_print.assert_called_once_with(
+        "/input", "/output", True, 2200, None
+    )
 
 
 @patch("bpmn_print.cli.pretty_print")
@@ -106,7 +110,9 @@ def test_run_with_keep_flag_long(mock_pretty_print, monkeypatch):
 
     run()
 
-    mock_pretty_print.assert_called_once_with("/input", "/output", True, 2200)
+    mock_pretty_print.assert_called_once_with(
+        "/input", "/output", True, 2200, None
+    )
 
 
 @patch("bpmn_print.cli.pretty_print")
@@ -119,7 +125,9 @@ def test_run_with_threshold_flag_short(mock_pretty_print, monkeypatch):
 
     run()
 
-    mock_pretty_print.assert_called_once_with("/input", "/output", False, 3000)
+    mock_pretty_print.assert_called_once_with(
+        "/input", "/output", False, 3000, None
+    )
 
 
 @patch("bpmn_print.cli.pretty_print")
@@ -138,7 +146,9 @@ def test_run_with_threshold_flag_long(mock_pretty_print, monkeypatch):
 
     run()
 
-    mock_pretty_print.assert_called_once_with("/input", "/output", False, 2500)
+    mock_pretty_print.assert_called_once_with(
+        "/input", "/output", False, 2500, None
+    )
 
 
 @patch("bpmn_print.cli.pretty_print")
@@ -151,7 +161,39 @@ def test_run_with_all_flags(mock_pretty_print, monkeypatch):
 
     run()
 
-    mock_pretty_print.assert_called_once_with("/input", "/output", True, 1800)
+    mock_pretty_print.assert_called_once_with(
+        "/input", "/output", True, 1800, None
+    )
+
+
+@pytest.mark.parametrize("option_jobs", ["-j", "--jobs"])
+@patch("bpmn_print.cli.pretty_print")
+def test_run_with_jobs_flag(mock_pretty_print, monkeypatch, option_jobs):
+    """Test run with -j/--jobs to set the number of worker processes."""
+    monkeypatch.setattr(
+        "sys.argv",
+        ["bpmn-print", option_jobs, "4", "/input", "/output"],
+    )
+
+    run()
+
+    mock_pretty_print.assert_called_once_with(
+        "/input", "/output", False, 2200, 4
+    )
+
+
+@pytest.mark.parametrize("jobs", ["0", "-2", "two"])
+def test_run_rejects_invalid_jobs(monkeypatch, jobs):
+    """Test that --jobs must be a positive integer."""
+    monkeypatch.setattr(
+        "sys.argv",
+        ["bpmn-print", "--jobs", jobs, "/input", "/output"],
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        run()
+
+    assert exc_info.value.code == 2
 
 
 @patch("bpmn_print.cli.console")
@@ -27,6 +27,16 @@ class TestSetLevel:
         assert console._logger.level == logging.CRITICAL
 
 
+class TestGetLevel:
+    """Tests for get_level function."""
+
+    def test_returns_level_set(self):
+        console.set_level(logging.WARNING)
+        assert console.get_level() == logging.WARNING
+        console.set_level(logging.INFO)
+        assert console.get_level() == logging.INFO
+
+
 class TestError:
     """Tests for error function."""
 
@@ -63,6 +63,12 @@ class TestBpmnNode:
         node2 = BpmnNode("id1", "name", "task")
         assert node1 == node2
 
+    def test_node_has_no_instance_dict(self):
+        """Test that BpmnNode uses slots instead of a per-instance dict."""
+        node = BpmnNode(node_id="task_1", name="Task", node_type="task")
+
+        assert not hasattr(node, "__dict__")
+
 
 class TestBpmnEdge:
     """Tests for BpmnEdge dataclass."""
@@ -256,16 +262,17 @@ class TestBpmnDiagramModel:
         assert conditions[0].number == 1
         assert conditions[1].number == 2
 
-    def test_conditions_built_in_post_init(self):
-        """Test that conditions are automatically built in __post_init__."""
+    def test_conditions_built_on_first_access(self):
+        """Test that conditions are built lazily and then cached."""
         edges = [BpmnEdge("a", "b", "[1]", "${x}", 1)]
         id_to_name = {"a": "A", "b": "B"}
 
         model = BpmnDiagramModel([], edges, id_to_name)
 
-        # Conditions should already be built without calling get_conditions
-        assert hasattr(model, "conditions")
+        # Nothing is built until the property is read
+        assert "conditions" not in vars(model)
         assert len(model.conditions) == 1
+        assert "conditions" in vars(model)
 
     def test_model_with_empty_data(self):
         """Test creating a model with empty nodes and edges."""
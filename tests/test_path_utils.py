@@ -93,6 +93,22 @@ class TestPrepareOutputPath:
             assert path == Path(tmpdir) / "file.tar"
             assert path.suffix == ".tar"
 
+    def test_keeps_other_suffix_with_auto_extension(self):
+        """Test that a suffix other than auto_extension is kept."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, "diagram.v2")
+            path, _ = prepare_output_path(output_path, ".png")
+
+            assert path == Path(tmpdir) / "diagram.v2"
+
+    def test_auto_extension_match_is_case_insensitive(self):
+        """Test that an upper-case matching extension is removed."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, "diagram.PNG")
+            path, _ = prepare_output_path(output_path, ".png")
+
+            assert path == Path(tmpdir) / "diagram"
+
     def test_file_without_extension_with_auto_extension(self):
         """Test file without extension when auto_extension provided."""
         with TemporaryDirectory() as tmpdir:
@@ -1,4 +1,7 @@
+import logging
+import os
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -8,10 +11,13 @@ from bpmn_print.pretty_print import (
     ConversionConfig,
     convert_bpmn_to_pdf,
     pretty_print,
+    _convert_all,
+    _list_bpmn_files,
     BPMN_EXTENSION,
     PDF_EXTENSION,
     PNG_EXTENSION,
 )
+from bpmn_print import console
 from bpmn_print.errors import BpmnRenderError
 
 
@@ -111,12 +117,10 @@ class TestConvertBpmnToPdf:
     @patch("bpmn_print.pretty_print.bpmn_data")
     @patch("bpmn_print.pretty_print.bpmn_diagram")
     @patch("bpmn_print.pretty_print.create_bpmn_context")
-    @patch("bpmn_print.pretty_print.os.path.exists")
     @patch("bpmn_print.pretty_print.os.remove")
     def test_removes_png_when_not_keeping(
         self,
         mock_remove,
-        mock_exists,
         mock_context,
         mock_diagram,
         mock_data,
@@ -128,7 +132,6 @@ class TestConvertBpmnToPdf:
         mock_data.extract.return_value = Mock(
             nodes=[], parameters=[], scripts=[]
         )
-        mock_exists.return_value = True
 
         config = ConversionConfig(
             bpmn_file="test.bpmn",
@@ -139,19 +142,16 @@ class TestConvertBpmnToPdf:
 
         convert_bpmn_to_pdf(config)
 
-        mock_exists.assert_called_once_with("test.png")
         mock_remove.assert_called_once_with("test.png")
 
     @patch("bpmn_print.pretty_print.pdf")
     @patch("bpmn_print.pretty_print.bpmn_data")
     @patch("bpmn_print.pretty_print.bpmn_diagram")
     @patch("bpmn_print.pretty_print.create_bpmn_context")
-    @patch("bpmn_print.pretty_print.os.path.exists")
     @patch("bpmn_print.pretty_print.os.remove")
     def test_keeps_png_when_requested(
         self,
         mock_remove,
-        mock_exists,
         mock_context,
         mock_diagram,
         mock_data,
@@ -173,21 +173,18 @@ class TestConvertBpmnToPdf:
 
         convert_bpmn_to_pdf(config)
 
-        mock_exists.assert_not_called()
         mock_remove.assert_not_called()
 
     @patch("bpmn_print.pretty_print.pdf")
     @patch("bpmn_print.pretty_print.bpmn_data")
     @patch("bpmn_print.pretty_print.bpmn_diagram")
     @patch("bpmn_print.pretty_print.create_bpmn_context")
-    @patch("bpmn_print.pretty_print.os.path.exists")
     @patch("bpmn_print.pretty_print.os.remove")
     @patch("bpmn_print.pretty_print.console")
     def test_handles_png_removal_error(
         self,
         mock_console,
         mock_remove,
-        mock_exists,
         mock_context,
         mock_diagram,
         mock_data,
@@ -199,7 +196,6 @@ class TestConvertBpmnToPdf:
         mock_data.extract.return_value = Mock(
             nodes=[], parameters=[], scripts=[]
         )
-        mock_exists.return_value = True
         mock_remove.side_effect = OSError("Permission denied")
 
         config = ConversionConfig(
@@ -216,6 +212,41 @@ class TestConvertBpmnToPdf:
             mock_console.warning.call_args
         )
 
+    @patch("bpmn_print.pretty_print.pdf")
+    @patch("bpmn_print.pretty_print.bpmn_data")
+    @patch("bpmn_print.pretty_print.bpmn_diagram")
+    @patch("bpmn_print.pretty_print.create_bpmn_context")
+    @patch("bpmn_print.pretty_print.os.remove")
+    @patch("bpmn_print.pretty_print.console")
+    def test_ignores_missing_png(
+        self,
+        mock_console,
+        mock_remove,
+        mock_context,
+        mock_diagram,
+        mock_data,
+        mock_pdf,
+    ):
+        """Test that an already missing PNG file is not reported."""
+        mock_context.return_value = Mock()
+        mock_diagram.render.return_value = []
+        mock_data.extract.return_value = Mock(
+            nodes=[], parameters=[], scripts=[]
+        )
+        mock_remove.side_effect = FileNotFoundError("test.png")
+
+        config = ConversionConfig(
+            bpmn_file="test.bpmn",
+            pdf_path="test.pdf",
+            png_file="test.png",
+            keep_png=False,
+        )
+
+        convert_bpmn_to_pdf(config)
+
+        mock_remove.assert_called_once_with("test.png")
+        mock_console.warning.assert_not_called()
+
     @patch("bpmn_print.pretty_print.pdf.make")
     @patch("bpmn_print.pretty_print.pdf.PdfData")
     @patch("bpmn_print.pretty_print.bpmn_data")
@@ -300,11 +331,110 @@ class TestPrettyPrint:
             (input_dir / "test2.bpmn").write_text("<bpmn/>")
             (input_dir / "test3.bpmn").write_text("<bpmn/>")
 
-            pretty_print(str(input_dir), str(output_dir))
+            # Threads stand in for the process pool so the mock sees calls
+            with patch(
+                "bpmn_print.pretty_print.ProcessPoolExecutor",
+                ThreadPoolExecutor,
+            ):
+                pretty_print(str(input_dir), str(output_dir))
 
             # Verify conversion was called 3 times
             assert mock_convert.call_count == 3
 
+    @patch("bpmn_print.pretty_print.ProcessPoolExecutor")
+    @patch("bpmn_print.pretty_print.convert_bpmn_to_pdf")
+    @patch("bpmn_print.pretty_print.console")
+    def test_single_worker_converts_in_process(
+        self, mock_console, mock_convert, mock_executor
+    ):
+        """Test that max_workers=1 converts files without a pool."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output"
+            input_dir.mkdir()
+
+            (input_dir / "test1.bpmn").write_text("<bpmn/>")
+            (input_dir / "test2.bpmn").write_text("<bpmn/>")
+
+            pretty_print(str(input_dir), str(output_dir), max_workers=1)
+
+            assert mock_convert.call_count == 2
+            mock_executor.assert_not_called()
+
+    @patch("bpmn_print.pretty_print.console")
+    def test_reports_pdfs_in_input_order(self, mock_console):
+        """Test that generated PDFs are reported in file order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output"
+            input_dir.mkdir()
+
+            (input_dir / "a.bpmn").write_text("<bpmn/>")
+            (input_dir / "b.bpmn").write_text("<bpmn/>")
+
+            with (
+                patch(
+                    "bpmn_print.pretty_print.ProcessPoolExecutor",
+                    ThreadPoolExecutor,
+                ),
+                patch("bpmn_print.pretty_print.convert_bpmn_to_pdf"),
+                patch(
+                    "bpmn_print.pretty_print._list_bpmn_files",
+                    return_value=sorted(
+                        os.scandir(input_dir),
+                        key=lambda e: e.name,
+                        reverse=True,
+                    ),
+                ),
+            ):
+                pretty_print(str(input_dir), str(output_dir))
+
+            generated = [
+                str(c)
+                for c in mock_console.info.call_args_list
+                if "Generated" in str(c)
+            ]
+            assert "b.pdf" in generated[0]
+            assert "a.pdf" in generated[1]
+
+    @pytest.mark.parametrize("max_workers", [1, None])
+    @patch("bpmn_print.pretty_print.convert_bpmn_to_pdf")
+    @patch("bpmn_print.pretty_print.console")
+    def test_progress_log_same_for_pool_and_in_process(
+        self, mock_console, mock_convert, max_workers
+    ):
+        """Test that each file logs Processing then Generated in turn."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output"
+            input_dir.mkdir()
+
+            (input_dir / "a.bpmn").write_text("<bpmn/>")
+            (input_dir / "b.bpmn").write_text("<bpmn/>")
+            entries = sorted(os.scandir(input_dir), key=lambda e: e.name)
+
+            with (
+                patch(
+                    "bpmn_print.pretty_print.ProcessPoolExecutor",
+                    ThreadPoolExecutor,
+                ),
+                patch(
+                    "bpmn_print.pretty_print._list_bpmn_files",
+                    return_value=entries,
+                ),
+            ):
+                pretty_print(
+                    str(input_dir), str(output_dir), max_workers=max_workers
+                )
+
+            messages = [c.args[0] for c in mock_console.info.call_args_list]
+            assert messages[1:] == [
+                "Processing a.bpmn...",
+                f"✓ Generated {output_dir / 'a.pdf'}",
+                "Processing b.bpmn...",
+                f"✓ Generated {output_dir / 'b.pdf'}",
+            ]
+
     @patch("bpmn_print.pretty_print.console")
     def test_creates_output_directory(self, mock_console):
         """Test that output directory is created if it doesn't exist."""
@@ -371,16 +501,16 @@ class TestPrettyPrint:
             assert any("No BPMN files found" in str(c) for c in calls)
 
     @patch("bpmn_print.pretty_print.console")
-    def test_input_dir_glob_oserror(self, mock_console):
-        """Test error handling when glob raises OSError."""
+    def test_input_dir_scandir_oserror(self, mock_console):
+        """Test error handling when scandir raises OSError."""
         with tempfile.TemporaryDirectory() as temp_dir:
             input_dir = Path(temp_dir) / "input"
             output_dir = Path(temp_dir) / "output"
             input_dir.mkdir()
 
-            # Mock Path.glob to raise OSError
-            with patch("pathlib.Path.glob") as mock_glob:
-                mock_glob.side_effect = OSError("Permission denied")
+            # Mock os.scandir to raise OSError
+            with patch("bpmn_print.pretty_print.os.scandir") as mock_scandir:
+                mock_scandir.side_effect = OSError("Permission denied")
 
                 from bpmn_print.errors import BpmnFileError
 
@@ -407,6 +537,25 @@ class TestPrettyPrint:
             assert config.pdf_path.endswith("workflow.pdf")
             assert config.png_file.endswith("workflow.png")
 
+    @patch("bpmn_print.pretty_print.convert_bpmn_to_pdf")
+    @patch("bpmn_print.pretty_print.console")
+    def test_output_paths_replace_only_final_extension(
+        self, mock_console, mock_convert
+    ):
+        """Test that only the trailing .bpmn is swapped for .pdf."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output"
+            input_dir.mkdir()
+
+            (input_dir / "my.bpmnflow.bpmn").write_text("<bpmn/>")
+
+            pretty_print(str(input_dir), str(output_dir))
+
+            config = mock_convert.call_args[0][0]
+            assert config.pdf_path == str(output_dir / "my.bpmnflow.pdf")
+            assert config.png_file == str(output_dir / "my.bpmnflow.png")
+
     @patch("bpmn_print.pretty_print.convert_bpmn_to_pdf")
     @patch("bpmn_print.pretty_print.console")
     def test_passes_keep_png_option(self, mock_console, mock_convert):
@@ -460,6 +609,132 @@ class TestPrettyPrint:
             assert mock_convert.call_count == 1
 
 
+class _StubExecutor:
+    """Executor stand-in whose first job fails and the rest stay queued."""
+
+    instances = []
+
+    def __init__(self, max_workers=None, initializer=None, initargs=()):
+        self.initializer = initializer
+        self.initargs = initargs
+        self.futures = []
+        _StubExecutor.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        if not self.futures:
+            future.set_exception(BpmnRenderError("boom"))
+        self.futures.append(future)
+        return future
+
+
+class TestConvertAll:
+    """Tests for _convert_all function."""
+
+    JOBS = [("a.bpmn", "a.pdf", "a.png"), ("b.bpmn", "b.pdf", "b.png")]
+
+    def test_converts_in_process_with_single_worker(self):
+        """Test that max_workers=1 runs jobs in order without a pool."""
+        convert = Mock()
+
+        with patch(
+            "bpmn_print.pretty_print.ProcessPoolExecutor"
+        ) as mock_executor:
+            _convert_all(convert, self.JOBS, 1)
+
+        assert [c.args[0] for c in convert.call_args_list] == self.JOBS
+        mock_executor.assert_not_called()
+
+    @patch("bpmn_print.pretty_print.console")
+    def test_names_file_before_in_process_failure(self, mock_console):
+        """Test that the failing file is logged before it is converted."""
+        convert = Mock(side_effect=[None, BpmnRenderError("boom")])
+
+        with pytest.raises(BpmnRenderError):
+            _convert_all(convert, self.JOBS, 1)
+
+        messages = [c.args[0] for c in mock_console.info.call_args_list]
+        assert messages == [
+            "Processing a.bpmn...",
+            "✓ Generated a.pdf",
+            "Processing b.bpmn...",
+        ]
+
+    @patch("bpmn_print.pretty_print.console")
+    def test_names_file_of_failed_worker(self, mock_console):
+        """Test that a failing pool job is reported with its BPMN path."""
+        with patch(
+            "bpmn_print.pretty_print.ProcessPoolExecutor", _StubExecutor
+        ):
+            with pytest.raises(BpmnRenderError):
+                _convert_all(Mock(), self.JOBS, None)
+
+        mock_console.info.assert_called_once_with("Processing a.bpmn...")
+        mock_console.warning.assert_called_once_with(
+            "Failed to convert a.bpmn"
+        )
+
+    def test_cancels_queued_jobs_after_failure(self):
+        """Test that jobs not yet started are cancelled on first error."""
+        _StubExecutor.instances.clear()
+
+        with patch(
+            "bpmn_print.pretty_print.ProcessPoolExecutor", _StubExecutor
+        ):
+            with pytest.raises(BpmnRenderError):
+                _convert_all(Mock(), self.JOBS, None)
+
+        futures = _StubExecutor.instances[0].futures
+        assert futures[1].cancelled()
+
+    def test_passes_console_level_to_workers(self):
+        """Test that workers are initialised with the console level."""
+        _StubExecutor.instances.clear()
+
+        with (
+            patch(
+                "bpmn_print.pretty_print.ProcessPoolExecutor", _StubExecutor
+            ),
+            patch(
+                "bpmn_print.pretty_print.console.get_level",
+                return_value=logging.WARNING,
+            ),
+        ):
+            with pytest.raises(BpmnRenderError):
+                _convert_all(Mock(), self.JOBS, None)
+
+        executor = _StubExecutor.instances[0]
+        assert executor.initializer is console.set_level
+        assert executor.initargs == (logging.WARNING,)
+
+
+class TestListBpmnFiles:
+    """Tests for _list_bpmn_files function."""
+
+    def test_lists_only_bpmn_files(self):
+        """Test that only regular .bpmn files are listed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            folder = Path(temp_dir)
+            (folder / "a.bpmn").write_text("<bpmn/>")
+            (folder / "notes.txt").write_text("text")
+            (folder / "dir.bpmn").mkdir()
+
+            entries = _list_bpmn_files(temp_dir)
+
+            assert [e.name for e in entries] == ["a.bpmn"]
+            assert entries[0].path == str(folder / "a.bpmn")
+
+    def test_missing_folder_lists_nothing(self):
+        """Test that a missing folder yields no files."""
+        assert _list_bpmn_files("/nonexistent/path/that/does/not/exist") == []
+
+
 class TestConstants:
     """Tests for module constants."""
 
@@ -4,9 +4,12 @@ from tempfile import TemporaryDirectory
 from lxml import etree
 from lxml.etree import _Element
 
+import os
+
 from bpmn_print.xml_utils import (
     parse_bpmn_xml,
     build_id_to_name_mapping,
+    create_bpmn_context,
 )
 from bpmn_print.errors import BpmnFileError, BpmnParseError
 
@@ -60,6 +63,22 @@ class TestParseBpmnXml:
 
             assert "Path is not a file" in str(exc_info.value)
 
+    def test_opens_file_once_without_stat_checks(self, monkeypatch):
+        """Test that the path is checked by opening it, not by stat."""
+        with TemporaryDirectory() as tmpdir:
+            xml_file = Path(tmpdir) / "test.bpmn"
+            xml_file.write_text("<root/>")
+
+            def fail(*args, **kwargs):
+                raise AssertionError("unexpected stat call")
+
+            monkeypatch.setattr(Path, "exists", fail)
+            monkeypatch.setattr(Path, "is_file", fail)
+
+            root = parse_bpmn_xml(str(xml_file))
+
+            assert root.tag == "root"
+
     def test_raises_error_when_file_not_readable(self, monkeypatch):
         """Test that BpmnFileError is raised when file can't be read."""
         with TemporaryDirectory() as tmpdir:
@@ -67,7 +86,7 @@ class TestParseBpmnXml:
             xml_file.write_text("<root/>")
 
             # Mock etree.parse to raise OSError
-            def failing_parse(file_path):
+            def failing_parse(file_path, parser=None):
                 raise OSError("Permission denied")
 
             monkeypatch.setattr(etree, "parse", failing_parse)
@@ -95,7 +114,7 @@ class TestParseBpmnXml:
             xml_file = Path(tmpdir) / "test.bpmn"
             xml_file.write_text("<root/>")
 
-            def failing_parse(file_path):
+            def failing_parse(file_path, parser=None):
                 raise OSError("Original error")
 
             monkeypatch.setattr(etree, "parse", failing_parse)
@@ -177,6 +196,57 @@ class TestParseBpmnXml:
         assert file_path in str(exc_info.value)
 
 
+class TestParserConfiguration:
+    """Tests for the parser options used by parse_bpmn_xml."""
+
+    def test_drops_whitespace_between_elements(self):
+        """Test that blank text between elements is not kept."""
+        with TemporaryDirectory() as tmpdir:
+            xml_file = Path(tmpdir) / "test.bpmn"
+            xml_file.write_text("<root>\n    <child/>\n</root>")
+
+            root = parse_bpmn_xml(str(xml_file))
+
+            assert root.text is None
+            assert root[0].tail is None
+
+    def test_keeps_leaf_text(self):
+        """Test that text content of leaf elements is preserved."""
+        with TemporaryDirectory() as tmpdir:
+            xml_file = Path(tmpdir) / "test.bpmn"
+            xml_file.write_text("<root>\n    <child> value </child>\n</root>")
+
+            root = parse_bpmn_xml(str(xml_file))
+
+            assert root[0].text == " value "
+
+    def test_drops_comments(self):
+        """Test that comments are removed and text around them joined."""
+        with TemporaryDirectory() as tmpdir:
+            xml_file = Path(tmpdir) / "test.bpmn"
+            xml_file.write_text(
+                "<root><!-- a --><child>x<!-- b -->y</child></root>"
+            )
+
+            root = parse_bpmn_xml(str(xml_file))
+
+            assert len(root) == 1
+            assert root[0].text == "xy"
+
+    def test_does_not_expand_custom_entities(self):
+        """Test that entities declared in an internal DTD stay unexpanded."""
+        with TemporaryDirectory() as tmpdir:
+            xml_file = Path(tmpdir) / "test.bpmn"
+            xml_file.write_text(
+                '<!DOCTYPE root [<!ENTITY e "expanded">]>'
+                "<root><child>&e;</child></root>"
+            )
+
+            root = parse_bpmn_xml(str(xml_file))
+
+            assert "expanded" not in etree.tostring(root).decode()
+
+
 class TestBuildIdToNameMapping:
     """Tests for build_id_to_name_mapping function."""
 
@@ -276,9 +346,43 @@ class TestBuildIdToNameMapping:
 
         mapping = build_id_to_name_mapping(root)
 
-        # Dict comprehension means last one wins
+        # Later assignments overwrite earlier ones, so the last one wins
         assert mapping["duplicate"] == "Second"
 
+    def test_skips_root_comments_and_processing_instructions(self):
+        """Test that only descendant elements are mapped."""
+        xml_content = """<?xml version="1.0"?>
+<root id="root1" name="Root">
+    <!-- comment -->
+    <?pi data?>
+    <element id="elem1" name="Element"/>
+</root>"""
+        root = etree.fromstring(xml_content.encode())
+
+        mapping = build_id_to_name_mapping(root)
+
+        assert mapping == {"elem1": "Element"}
+
+    def test_skips_bpmn_diagram_layout(self):
+        """Test that bpmndi:BPMNDiagram IDs are not mapped."""
+        xml_content = """<?xml version="1.0"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL"
+             xmlns:bpmndi="http://www.omg.org/spec/BPMN/20100524/DI">
+    <process id="Process_1" name="Main">
+        <task id="Task_1" name="Work"/>
+    </process>
+    <bpmndi:BPMNDiagram id="Diagram_1">
+        <bpmndi:BPMNPlane id="Plane_1" bpmnElement="Process_1">
+            <bpmndi:BPMNShape id="Shape_1" bpmnElement="Task_1"/>
+        </bpmndi:BPMNPlane>
+    </bpmndi:BPMNDiagram>
+</definitions>"""
+        root = etree.fromstring(xml_content.encode())
+
+        mapping = build_id_to_name_mapping(root)
+
+        assert mapping == {"Process_1": "Main", "Task_1": "Work"}
+
     def test_with_bpmn_namespaces(self):
         """Test with actual BPMN namespace structure."""
         xml_content = """<?xml version="1.0"?>
@@ -369,6 +473,59 @@ class TestBuildIdToNameMapping:
         assert len(mapping["elem1"]) == 1000
 
 
+class TestCreateBpmnContext:
+    """Tests for create_bpmn_context function."""
+
+    XML = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL">
+    <process id="Process_1">
+        <startEvent id="StartEvent_1" name="Start"/>
+    </process>
+</definitions>"""
+
+    def test_builds_context(self):
+        """Test building root and ID-to-name mapping from a file."""
+        with TemporaryDirectory() as tmpdir:
+            xml_file = Path(tmpdir) / "test.bpmn"
+            xml_file.write_text(self.XML)
+
+            context = create_bpmn_context(str(xml_file))
+
+            assert context.root.tag.endswith("definitions")
+            assert context.id_to_name["StartEvent_1"] == "Start"
+
+    def test_reuses_context_for_unchanged_file(self):
+        """Test that an unchanged file is not parsed again."""
+        with TemporaryDirectory() as tmpdir:
+            xml_file = Path(tmpdir) / "test.bpmn"
+            xml_file.write_text(self.XML)
+
+            first = create_bpmn_context(str(xml_file))
+            second = create_bpmn_context(str(xml_file))
+
+            assert first is second
+
+    def test_reparses_modified_file(self):
+        """Test that a modified file produces a fresh context."""
+        with TemporaryDirectory() as tmpdir:
+            xml_file = Path(tmpdir) / "test.bpmn"
+            xml_file.write_text(self.XML)
+            first = create_bpmn_context(str(xml_file))
+
+            xml_file.write_text(self.XML.replace('"Start"', '"Begin"'))
+            stat = xml_file.stat()
+            os.utime(xml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+            second = create_bpmn_context(str(xml_file))
+
+            assert first is not second
+            assert second.id_to_name["StartEvent_1"] == "Begin"
+
+    def test_raises_error_when_file_not_found(self):
+        """Test that missing files still raise BpmnFileError."""
+        with pytest.raises(BpmnFileError):
+            create_bpmn_context("/nonexistent/file.bpmn")
+
+
 class TestIntegration:
     """Integration tests for xml_utils functions."""
 